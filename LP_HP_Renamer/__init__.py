@@ -0,0 +1,126 @@
+bl_info = {
+    "name": "Ed's LPHP Tool",
+    "author": "edisan27",
+    "version": (0, 2),
+    "blender": (4, 3, 2),
+    "location": "View3D > Sidebar > Ed's Tools",
+    "description": "Bunch of tools I find useful",
+    "category": "Object",
+}
+
+# Nothing is imported at module level: Blender reads bl_info from every
+# addon at startup, and the library audit's worker processes import this
+# package without bpy. Submodules are loaded by register(), and the heavy
+# ones (exporter, baker, uvcheck, library_audit, query) only by the operators
+# that use them.
+
+def get_classes():
+    from . import ops_audit, ops_bake, ops_export, ops_normals, ops_query, ops_rename, ops_uvcheck, properties, ui
+
+    return [
+        properties.ExportCollectionItem,
+        properties.ExportPreset,
+        properties.UVCheckResult,
+        properties.RenameSettings,
+
+        ops_rename.OBJECT_OT_RenameLPHP,
+        ops_rename.OBJECT_OT_SwapLPHP,
+        ops_rename.OBJECT_OT_SwapLPHPCollections,
+        ops_rename.OBJECT_OT_SwapLPHPNames,
+
+        ops_rename.OBJECT_OT_VerifyLPPairs,
+        ops_rename.OBJECT_OT_RebuildPairLinks,
+        ops_rename.OBJECT_OT_CheckPairLinks,
+        ops_rename.OBJECT_OT_FindReplaceNames,
+
+        ops_export.OBJECT_OT_RefreshExportCollections,
+        ops_export.OBJECT_OT_RefreshCollectionStats,
+
+        ui.VIEW3D_PT_RenamePanel,
+        ui.VIEW3D_PT_ExportPanel,
+
+        ops_export.OBJECT_OT_ExportSelectedCollections,
+        ops_export.OBJECT_OT_ExportSelectedMeshSets,
+
+        ops_export.EXPORT_UL_Presets,
+        ops_export.OBJECT_OT_AddExportPreset,
+        ops_export.OBJECT_OT_RemoveExportPreset,
+        ops_export.OBJECT_OT_StoreExportPreset,
+        ops_export.OBJECT_OT_LoadExportPreset,
+        ops_export.OBJECT_OT_ExportAllPresets,
+
+        ui.VIEW3D_PT_BakePanel,
+        ops_bake.OBJECT_OT_BakeLPHPPairs,
+
+        ui.VIEW3D_PT_UVCheckPanel,
+        ops_uvcheck.LPHP_UL_UVCheckResults,
+        ops_uvcheck.OBJECT_OT_CheckLPUVs,
+        ops_uvcheck.OBJECT_OT_SelectUVCheckResult,
+
+        ui.VIEW3D_PT_LibraryAuditPanel,
+        ops_audit.OBJECT_OT_AuditLibraryPairs,
+
+        ui.VIEW3D_PT_QueryPanel,
+        ops_query.OBJECT_OT_SelectByQuery,
+
+        ui.VIEW3D_PT_WeightedNormalizerPanel,
+        ops_normals.OBJECT_OT_AddWeightedNormal,
+        ops_normals.OBJECT_OT_DelWeightedNormal,
+        ops_normals.OBJECT_OT_VerifyWeightedNormal,
+        ops_normals.OBJECT_OT_EnableKeepSharp,
+        ops_normals.OBJECT_OT_DisableKeepSharp,
+        ops_normals.OBJECT_OT_ToggleWireOverlay,
+    ]
+
+def get_app_handlers():
+    import bpy
+    from . import autoexport, meshstats
+
+    return [
+        (bpy.app.handlers.depsgraph_update_post, meshstats.mesh_counts_depsgraph_update),
+        (bpy.app.handlers.load_post, meshstats.mesh_counts_load_post),
+        (bpy.app.handlers.depsgraph_update_post, autoexport.auto_export_depsgraph_update),
+        (bpy.app.handlers.save_post, autoexport.auto_export_save_post),
+        (bpy.app.handlers.load_post, autoexport.auto_export_load_post),
+    ]
+
+def register():
+    import bpy
+    from .properties import RenameSettings
+
+    for cls in get_classes():
+        bpy.utils.register_class(cls)
+    bpy.types.Scene.rename_settings = bpy.props.PointerProperty(type=RenameSettings)
+    bpy.types.Object.lphp_pair = bpy.props.PointerProperty(
+        type=bpy.types.Object, name="LP/HP Pair",
+        description="Counterpart of this object, kept through renames"
+    )
+    bpy.types.Object.lphp_side = bpy.props.EnumProperty(
+        name="LP/HP Side",
+        items=[
+            ('NONE', "None", "Not part of a pair"),
+            ('LP', "Low Poly", "Low Poly side of the pair"),
+            ('HP', "High Poly", "High Poly side of the pair"),
+        ],
+        default='NONE'
+    )
+
+    for handler_list, handler in get_app_handlers():
+        if handler not in handler_list:
+            handler_list.append(handler)
+
+def unregister():
+    import bpy
+    from .autoexport import auto_export_timer
+
+    for handler_list, handler in get_app_handlers():
+        if handler in handler_list:
+            handler_list.remove(handler)
+    if bpy.app.timers.is_registered(auto_export_timer):
+        bpy.app.timers.unregister(auto_export_timer)
+
+    for cls in reversed(get_classes()):
+        bpy.utils.unregister_class(cls)
+    del bpy.types.Scene.rename_settings
+    del bpy.types.Object.lphp_pair
+    del bpy.types.Object.lphp_side
@@ -0,0 +1,139 @@
+import os
+import time
+
+import bpy
+from bpy.app.handlers import persistent
+
+from .utils import select_only
+
+# Objects changed since they were last exported (by name_full), filled by
+# the depsgraph handler while auto export is enabled
+auto_export_state = {
+    "dirty": set(),
+    "deadline": 0.0,
+    "exporting": False,
+}
+
+def run_auto_export(context):
+    from .exporter import (
+        export_fbx_chunked,
+        export_fbx_objects,
+        get_preset_export_jobs,
+        get_settings_export_jobs,
+        restore_export_visibility,
+        stage_export_objects,
+        unstage_export_objects,
+    )
+
+    settings = context.scene.rename_settings
+    export_root = bpy.path.abspath(settings.export_path)
+    dirty = set(auto_export_state["dirty"])
+
+    if not export_root or not dirty:
+        return 0
+
+    membership = {}
+    jobs = get_settings_export_jobs(settings, export_root, membership)
+    if settings.auto_export_presets:
+        for preset in settings.export_presets:
+            if preset.enabled:
+                jobs.extend(get_preset_export_jobs(preset, export_root, membership))
+
+    # Only sets containing at least one changed object are exported again
+    jobs = [job for job in jobs if any(obj.name_full in dirty for obj in job[1])]
+
+    # Chunked sets stage one chunk at a time on their own, staging them with
+    # the rest would evaluate the whole HP set at once
+    chunked_jobs = [job for job in jobs if job[5]]
+    single_jobs = [job for job in jobs if not job[5]]
+
+    # Exporting selects each set in turn, the user's selection is put back
+    # afterwards since nothing in the UI asked for it to change
+    view_layer = context.view_layer
+    saved_selection = [obj.name_full for obj in context.selected_objects]
+    saved_active = view_layer.objects.active.name_full if view_layer.objects.active else None
+
+    try:
+        for set_type, objects, filepath, mesh_only, exclude_anim, chunk_tris in chunked_jobs:
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            index_path, chunk_count = export_fbx_chunked(context, objects, filepath, chunk_tris, mesh_only, exclude_anim)
+            print(f"Auto exported {set_type} set ({len(objects)} objects) in {chunk_count} chunk(s), index: {index_path}")
+
+        if single_jobs:
+            all_objects = {}
+            for _set_type, objects, _path, _mesh_only, _exclude_anim, _chunk_tris in single_jobs:
+                for obj in objects:
+                    all_objects.setdefault(obj.name_full, obj)
+
+            # Nobody asked for this export, so hidden objects must end up hidden
+            # again or the just saved file would look (and be) modified
+            mesh_hashes = {}
+            saved_visibility = []
+            temp_collection = stage_export_objects(context, all_objects.values(), saved_visibility)
+            try:
+                for set_type, objects, filepath, mesh_only, exclude_anim, _chunk_tris in single_jobs:
+                    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+                    export_fbx_objects(context, objects, filepath, mesh_only, exclude_anim, mesh_hashes)
+                    print(f"Auto exported {set_type} set ({len(objects)} objects) to {filepath}")
+            finally:
+                restore_export_visibility(saved_visibility)
+                unstage_export_objects(context, temp_collection)
+    finally:
+        layer_objects = {obj.name_full: obj for obj in view_layer.objects}
+        select_only(context, [layer_objects[name] for name in saved_selection if name in layer_objects])
+        view_layer.objects.active = layer_objects.get(saved_active)
+
+    # Changes on objects outside every export set don't need to linger
+    auto_export_state["dirty"].difference_update(dirty)
+    return len(jobs)
+
+def auto_export_timer():
+    # Runs on the main thread once the debounce window has passed,
+    # saving has already returned by then
+    remaining = auto_export_state["deadline"] - time.monotonic()
+    if remaining > 0:
+        return remaining
+
+    window_manager = bpy.context.window_manager
+    window = window_manager.windows[0] if window_manager and window_manager.windows else None
+
+    try:
+        if window:
+            with bpy.context.temp_override(window=window):
+                run_auto_export(bpy.context)
+        else:
+            run_auto_export(bpy.context)
+    except Exception as e:
+        auto_export_state["exporting"] = False
+        print(f"Auto export failed: {e}")
+
+    return None
+
+@persistent
+def auto_export_depsgraph_update(scene, depsgraph):
+    if auto_export_state["exporting"]:
+        return
+    if not scene.rename_settings.auto_export_on_save:
+        return
+
+    # Geometry covers mesh edits and modifier changes
+    dirty = auto_export_state["dirty"]
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object) and (update.is_updated_geometry or update.is_updated_transform):
+            dirty.add(update.id.original.name_full)
+
+@persistent
+def auto_export_save_post(*_args):
+    settings = bpy.context.scene.rename_settings
+    if not settings.auto_export_on_save or not auto_export_state["dirty"]:
+        return
+
+    # Each save pushes the deadline back so bursts of saves export once
+    auto_export_state["deadline"] = time.monotonic() + settings.auto_export_delay
+    if not bpy.app.timers.is_registered(auto_export_timer):
+        bpy.app.timers.register(auto_export_timer, first_interval=settings.auto_export_delay)
+
+@persistent
+def auto_export_load_post(*_args):
+    auto_export_state["dirty"].clear()
+    auto_export_state["exporting"] = False
@@ -0,0 +1,232 @@
+import json
+import os
+import subprocess
+import time
+import uuid
+
+import bpy
+
+from .exporter import restore_export_visibility, stage_export_objects, unstage_export_objects
+from .pairs import collect_lp_hp_pairs
+from .utils import select_only
+
+# Pass key -> (file suffix, Cycles bake type, pass filter, non-color data)
+BAKE_PASSES = {
+    'NORMAL': ("normal", 'NORMAL', set(), True),
+    'AO': ("ao", 'AO', set(), False),
+    'ID': ("id", 'DIFFUSE', {'COLOR'}, False),
+}
+
+# Run inside each background worker: puts the addon's parent folder on
+# sys.path, imports and registers the package by name, then bakes the LP
+# objects given after "--" through <package>.baker.bake_worker_main
+BAKE_WORKER_EXPR = (
+    "import sys, importlib\n"
+    "args = sys.argv[sys.argv.index('--') + 1:]\n"
+    "sys.path.insert(0, args[0])\n"
+    "importlib.import_module(args[1]).register()\n"
+    "importlib.import_module(args[1] + '.baker').bake_worker_main(args[2:])\n"
+)
+
+def get_enabled_bake_passes(settings):
+    passes = []
+    if settings.bake_normal:
+        passes.append('NORMAL')
+    if settings.bake_ao:
+        passes.append('AO')
+    if settings.bake_id:
+        passes.append('ID')
+    return passes
+
+def configure_bake_session(scene, settings, threads=0):
+    # Scene bake settings are set once for the whole queue, bake calls
+    # then only pass the bake type. Returns what is needed to restore them.
+    render = scene.render
+    bake = render.bake
+    values = [
+        (render, "engine", 'CYCLES'),
+        (scene.cycles, "device", 'CPU'),
+        (scene.cycles, "samples", settings.bake_samples),
+        (bake, "target", 'IMAGE_TEXTURES'),
+        (bake, "use_selected_to_active", True),
+        (bake, "use_clear", True),
+        (bake, "margin", settings.bake_margin),
+        (bake, "cage_extrusion", settings.bake_cage_extrusion),
+        (bake, "max_ray_distance", settings.bake_max_ray_distance),
+    ]
+    if threads:
+        values.append((render, "threads_mode", 'FIXED'))
+        values.append((render, "threads", threads))
+
+    previous = []
+    for owner, attr, value in values:
+        previous.append((owner, attr, getattr(owner, attr)))
+        setattr(owner, attr, value)
+    return previous
+
+def restore_bake_session(previous):
+    for owner, attr, value in reversed(previous):
+        setattr(owner, attr, value)
+
+def bake_pair(context, settings, base, lp_obj, hp_obj, out_dir, passes):
+    result = {"pair": base, "lp": lp_obj.name, "hp": hp_obj.name, "maps": {}, "seconds": 0.0, "error": None}
+    start = time.perf_counter()
+
+    if not lp_obj.data.uv_layers:
+        result["error"] = "LP has no UV map"
+        return result
+
+    # The LP needs a material with an active image node to bake into
+    temp_material = None
+    if not any(slot.material for slot in lp_obj.material_slots):
+        temp_material = bpy.data.materials.new("__lphp_bake_tmp")
+        temp_material.use_nodes = True
+        lp_obj.data.materials.append(temp_material)
+
+    resolution = settings.bake_resolution
+    image = bpy.data.images.new(f"__lphp_bake_{base}", resolution, resolution, alpha=False)
+
+    materials = {slot.material.name_full: slot.material for slot in lp_obj.material_slots if slot.material}
+    image_nodes = []
+    for material in materials.values():
+        material.use_nodes = True
+        nodes = material.node_tree.nodes
+        previous_active = nodes.active
+        node = nodes.new('ShaderNodeTexImage')
+        node.image = image
+        nodes.active = node
+        image_nodes.append((nodes, node, previous_active))
+
+    select_only(context, [hp_obj, lp_obj])
+    context.view_layer.objects.active = lp_obj
+
+    try:
+        for pass_key in passes:
+            file_suffix, bake_type, pass_filter, non_color = BAKE_PASSES[pass_key]
+            pass_start = time.perf_counter()
+
+            image.colorspace_settings.name = 'Non-Color' if non_color else 'sRGB'
+            if pass_filter:
+                bpy.ops.object.bake(type=bake_type, pass_filter=pass_filter)
+            else:
+                bpy.ops.object.bake(type=bake_type)
+
+            filepath = os.path.join(out_dir, f"{base}_{file_suffix}.png")
+            image.filepath_raw = filepath
+            image.file_format = 'PNG'
+            image.save()
+
+            result["maps"][file_suffix] = {
+                "file": os.path.basename(filepath),
+                "seconds": round(time.perf_counter() - pass_start, 3),
+            }
+    except RuntimeError as e:
+        result["error"] = str(e)
+    finally:
+        for nodes, node, previous_active in image_nodes:
+            nodes.remove(node)
+            if previous_active:
+                nodes.active = previous_active
+        if temp_material:
+            lp_obj.data.materials.pop(index=len(lp_obj.data.materials) - 1)
+            bpy.data.materials.remove(temp_material)
+        bpy.data.images.remove(image)
+
+    result["seconds"] = round(time.perf_counter() - start, 3)
+    return result
+
+def run_bake_session(context, settings, pairs, out_dir, threads=0):
+    passes = get_enabled_bake_passes(settings)
+    previous = configure_bake_session(context.scene, settings, threads)
+
+    # Bake needs every object visible and selectable, stage them all once
+    objects = {}
+    for _base, lp_obj, hp_obj in pairs:
+        objects.setdefault(lp_obj.name_full, lp_obj)
+        objects.setdefault(hp_obj.name_full, hp_obj)
+
+    saved_visibility = []
+    temp_collection = stage_export_objects(context, objects.values(), saved_visibility)
+    results = []
+    try:
+        for base, lp_obj, hp_obj in pairs:
+            result = bake_pair(context, settings, base, lp_obj, hp_obj, out_dir, passes)
+            print(f"Baked {base} in {result['seconds']:.2f}s" +
+                  (f" (error: {result['error']})" if result["error"] else ""))
+            results.append(result)
+    finally:
+        select_only(context, [])
+        restore_export_visibility(saved_visibility)
+        unstage_export_objects(context, temp_collection)
+        restore_bake_session(previous)
+
+    return results
+
+def run_bake_workers(context, pairs, out_dir, workers):
+    # Each worker bakes a slice of the queue from a saved copy of this file,
+    # Cycles threads are split between them to avoid oversubscription
+    settings = context.scene.rename_settings
+    blend_copy = os.path.join(out_dir, f"__lphp_bake_{uuid.uuid4().hex[:6]}.blend")
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    # One deadline for all workers, they run side by side
+    deadline = time.monotonic() + settings.bake_worker_timeout * 60
+
+    processes = []
+    results = []
+    try:
+        bpy.ops.wm.save_as_mainfile(filepath=blend_copy, copy=True)
+
+        for index in range(workers):
+            bases = [base for base, _lp, _hp in pairs[index::workers]]
+            lp_names = [lp_obj.name for _base, lp_obj, _hp in pairs[index::workers]]
+            if not bases:
+                continue
+            report_path = os.path.join(out_dir, f"__lphp_bake_worker_{index}.json")
+            command = [
+                bpy.app.binary_path, "--factory-startup", "-b", blend_copy,
+                "--python-expr", BAKE_WORKER_EXPR,
+                "--", package_root, __package__, report_path, str(threads), *lp_names,
+            ]
+            processes.append((subprocess.Popen(command), report_path, bases))
+
+        for process, report_path, bases in processes:
+            try:
+                process.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                results.extend({"pair": base, "maps": {}, "seconds": 0.0,
+                                "error": f"Worker timed out after {settings.bake_worker_timeout} min"}
+                               for base in bases)
+                continue
+            try:
+                with open(report_path, encoding="utf-8") as f:
+                    results.extend(json.load(f))
+            except (OSError, ValueError):
+                results.extend({"pair": base, "maps": {}, "seconds": 0.0,
+                                "error": f"Worker exited with code {process.returncode}"} for base in bases)
+    finally:
+        # Workers still running here were left behind by an exception
+        for process, report_path, _bases in processes:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            if os.path.exists(report_path):
+                os.remove(report_path)
+        if os.path.exists(blend_copy):
+            os.remove(blend_copy)
+
+    return sorted(results, key=lambda result: result["pair"])
+
+def bake_worker_main(args):
+    report_path, threads, lp_names = args[0], int(args[1]), args[2:]
+    context = bpy.context
+    settings = context.scene.rename_settings
+
+    lp_objects = [bpy.data.objects[name] for name in lp_names if name in bpy.data.objects]
+    pairs = collect_lp_hp_pairs(lp_objects, settings.lp_suffix, settings.hp_suffix)
+
+    results = run_bake_session(context, settings, pairs, os.path.dirname(report_path), threads)
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(results, f)
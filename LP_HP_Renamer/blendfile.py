@@ -0,0 +1,176 @@
+# Reads ID names straight from .blend file blocks. Must not import bpy:
+# the library audit runs these functions in separate worker processes.
+
+import gzip
+import io
+import re
+import struct
+
+# Only these blocks are read, everything else is skipped over
+BLEND_ID_CODES = {
+    b'OB\x00\x00': "objects",
+    b'GR\x00\x00': "collections",
+}
+
+# Enough of an ID block to cover ID.name in every known layout
+BLEND_ID_HEAD_SIZE = 512
+
+def open_blend_file(path):
+    with open(path, 'rb') as f:
+        magic = f.read(4)
+
+    if magic[:2] == b'\x1f\x8b':
+        return gzip.open(path, 'rb')
+    if magic == b'\x28\xb5\x2f\xfd':
+        try:
+            from compression import zstd
+            return zstd.open(path, 'rb')
+        except ImportError:
+            pass
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError("zstd compressed .blend and no zstd module available")
+        # Blender writes many independent frames plus a skippable seek table
+        # frame, by default the reader would stop after the first frame
+        return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True, read_across_frames=True)
+    return open(path, 'rb')
+
+def read_exact(f, count):
+    # Decompressing readers may return short reads at frame boundaries,
+    # only an empty read means the end of the file
+    data = f.read(count)
+    while len(data) < count:
+        chunk = f.read(count - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+def skip_bytes(f, count):
+    try:
+        f.seek(count, io.SEEK_CUR)
+    except (OSError, ValueError, io.UnsupportedOperation):
+        while count > 0:
+            chunk = f.read(min(count, 1 << 20))
+            if not chunk:
+                break
+            count -= len(chunk)
+
+def get_sdna_id_name_field(dna, endian, pointer_size):
+    # Returns (offset, size) of ID.name using the file's own struct layout
+    if dna[:8] != b'SDNANAME':
+        raise ValueError("Invalid DNA1 block")
+
+    def read_strings(pos):
+        count = struct.unpack_from(endian + 'i', dna, pos)[0]
+        pos += 4
+        strings = []
+        for _ in range(count):
+            end = dna.index(b'\x00', pos)
+            strings.append(dna[pos:end].decode('latin-1'))
+            pos = end + 1
+        return strings, (pos + 3) & ~3
+
+    names, pos = read_strings(8)
+    if dna[pos:pos + 4] != b'TYPE':
+        raise ValueError("Invalid DNA1 block")
+    types, pos = read_strings(pos + 4)
+    if dna[pos:pos + 4] != b'TLEN':
+        raise ValueError("Invalid DNA1 block")
+    lengths = struct.unpack_from(f"{endian}{len(types)}H", dna, pos + 4)
+    pos = (pos + 4 + 2 * len(types) + 3) & ~3
+    if dna[pos:pos + 4] != b'STRC':
+        raise ValueError("Invalid DNA1 block")
+
+    struct_count = struct.unpack_from(endian + 'i', dna, pos + 4)[0]
+    pos += 8
+    for _ in range(struct_count):
+        type_index, field_count = struct.unpack_from(endian + 'HH', dna, pos)
+        pos += 4
+        fields = struct.unpack_from(f"{endian}{2 * field_count}H", dna, pos)
+        pos += 4 * field_count
+        if types[type_index] != 'ID':
+            continue
+
+        offset = 0
+        for field_type, field_name in zip(fields[::2], fields[1::2]):
+            name = names[field_name]
+            array_len = 1
+            for dim in re.findall(r'\[(\d+)\]', name):
+                array_len *= int(dim)
+            if name.startswith('*') or name.startswith('(*'):
+                size = pointer_size * array_len
+            else:
+                size = lengths[field_type] * array_len
+            if name.startswith('name['):
+                return offset, size
+            offset += size
+        break
+
+    raise ValueError("ID.name not found in DNA1 block")
+
+def read_blend_id_names(path):
+    # Reads object and collection names from the file blocks without
+    # loading any data. Needs no bpy, so it's safe to run off the main thread.
+    with open_blend_file(path) as f:
+        header = read_exact(f, 12)
+        if header[:7] != b'BLENDER':
+            raise ValueError("Not a .blend file")
+
+        if header[7:8] in (b'_', b'-'):
+            # BLENDER-v404: pointer size, endianness, version
+            pointer_size = 4 if header[7:8] == b'_' else 8
+            endian = '<' if header[8:9] == b'v' else '>'
+            bhead = struct.Struct(endian + '4si' + ('I' if pointer_size == 4 else 'Q') + 'ii')
+            length_index = 1
+        else:
+            # BLENDER17-01v0500: header size, file format, endianness, version
+            header += read_exact(f, int(header[7:9]) - 12)
+            if header[9:12] != b'-01':
+                raise ValueError("Unsupported .blend file format")
+            pointer_size = 8
+            endian = '<' if header[12:13] == b'v' else '>'
+            bhead = struct.Struct(endian + '4siQqq')
+            length_index = 3
+
+        heads = {kind: [] for kind in BLEND_ID_CODES.values()}
+        id_name = None
+        while True:
+            raw = read_exact(f, bhead.size)
+            if len(raw) < bhead.size:
+                break
+            fields = bhead.unpack(raw)
+            code, length = fields[0], fields[length_index]
+            if code == b'ENDB':
+                break
+
+            kind = BLEND_ID_CODES.get(code)
+            if kind:
+                head = read_exact(f, min(length, BLEND_ID_HEAD_SIZE))
+                heads[kind].append(head)
+                skip_bytes(f, length - len(head))
+            elif code == b'DNA1':
+                id_name = get_sdna_id_name_field(read_exact(f, length), endian, pointer_size)
+            else:
+                skip_bytes(f, length)
+
+    if id_name is None:
+        raise ValueError("No DNA1 block found")
+
+    offset, size = id_name
+    # ID names carry a two letter type prefix ("OBCube")
+    return {
+        kind: [head[offset:offset + size].split(b'\x00', 1)[0].decode('utf-8', 'replace')[2:]
+               for head in kind_heads]
+        for kind, kind_heads in heads.items()
+    }
+
+def read_blend_id_names_safe(path):
+    # Pool friendly variant: errors come back as text instead of raising.
+    # A damaged file can fail anywhere (EOFError from a truncated gzip
+    # stream, ZstdError, IndexError), it must never take the audit down.
+    try:
+        return read_blend_id_names(path), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
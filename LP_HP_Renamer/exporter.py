@@ -0,0 +1,410 @@
+import gc
+import hashlib
+import json
+import os
+import sys
+import time
+import uuid
+from array import array
+
+import bpy
+from mathutils import Vector
+
+from .autoexport import auto_export_state
+from .meshstats import estimate_evaluated_tris, get_mesh_counts
+from .pairs import find_counterpart, get_pair_side
+from .utils import format_instance_savings, get_mesh_set_objects, group_objects_by_mesh, select_only
+
+def stage_export_objects(context, export_objects, saved_visibility=None):
+    # Link export objects to a temp collection & unhide them so the
+    # exporter sees them even if their own collections are hidden.
+    # Pass a list as saved_visibility to be able to restore them afterwards.
+    auto_export_state["exporting"] = True
+
+    temp_col_name = f"__temp_export_{uuid.uuid4().hex[:6]}"
+    temp_collection = bpy.data.collections.new(temp_col_name)
+    context.scene.collection.children.link(temp_collection)
+
+    for obj in export_objects:
+        temp_collection.objects.link(obj)
+        if saved_visibility is not None:
+            saved_visibility.append((obj, obj.hide_get(), obj.hide_viewport, obj.hide_render))
+        obj.hide_set(False)
+        obj.hide_viewport = False
+        obj.hide_render = False
+
+    return temp_collection
+
+def restore_export_visibility(saved_visibility):
+    # Must run before unstaging, hide_set needs the object in the view layer
+    for obj, hidden, hide_viewport, hide_render in saved_visibility:
+        obj.hide_set(hidden)
+        obj.hide_viewport = hide_viewport
+        obj.hide_render = hide_render
+
+def unstage_export_objects(context, temp_collection):
+    context.scene.collection.children.unlink(temp_collection)
+    bpy.data.collections.remove(temp_collection)
+    auto_export_state["exporting"] = False
+
+def get_manifest_path(filepath):
+    return os.path.splitext(filepath)[0] + ".manifest.jsonl"
+
+def hash_mesh(mesh):
+    # Geometry and active UVs through bulk reads, no per-vertex Python work
+    digest = hashlib.blake2b(digest_size=16)
+    buffers = [
+        (mesh.vertices, "co", 'f', 3),
+        (mesh.polygons, "loop_total", 'i', 1),
+        (mesh.loops, "vertex_index", 'i', 1),
+    ]
+    if mesh.uv_layers.active:
+        buffers.append((mesh.uv_layers.active.data, "uv", 'f', 2))
+
+    for collection, attribute, typecode, width in buffers:
+        values = array(typecode, [0]) * (len(collection) * width)
+        collection.foreach_get(attribute, values)
+        digest.update(len(values).to_bytes(8, 'little'))
+        digest.update(values)
+    return digest.hexdigest()
+
+# Modifier settings spelled out in the manifest summary. The content hash
+# covers every setting, these are the ones worth reading in a diff.
+MANIFEST_MODIFIER_FIELDS = ("levels", "render_levels", "keep_sharp", "weight", "mode")
+
+# Panel state only, doesn't change the exported mesh
+MODIFIER_UI_PROPERTIES = {
+    "rna_type", "name", "show_expanded", "show_in_editmode", "show_on_cage",
+    "is_active", "is_override_data_editable", "persistent_uid", "use_pin_to_last",
+}
+
+def get_setting_value(value):
+    # IDs by name and floats rounded so the result is stable between
+    # sessions, nothing that prints a memory address
+    if isinstance(value, bpy.types.ID):
+        return value.name_full
+    if isinstance(value, float):
+        return round(value, 6)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if hasattr(value, "to_dict"):
+        return {key: get_setting_value(item) for key, item in value.to_dict().items()}
+    if hasattr(value, "to_list"):
+        value = value.to_list()
+    if isinstance(value, (str, bytes)) or not hasattr(value, "__iter__"):
+        return value
+    return [get_setting_value(item) for item in value]
+
+def get_modifier_settings(mod):
+    # Every setting of the modifier that changes the exported mesh,
+    # read-only properties are runtime state (e.g. execution_time)
+    settings = {"type": mod.type}
+    for prop in mod.bl_rna.properties:
+        key = prop.identifier
+        if key in MODIFIER_UI_PROPERTIES or prop.type == 'COLLECTION' or prop.is_readonly:
+            continue
+        value = getattr(mod, key)
+        if prop.type == 'POINTER':
+            value = getattr(value, "name_full", None) if value is not None else None
+        settings[key] = get_setting_value(value)
+
+    # Geometry Nodes inputs are ID properties, not RNA. Other modifier
+    # types don't support ID properties at all.
+    if mod.type == 'NODES':
+        for key in mod.keys():
+            settings[f"[{key}]"] = get_setting_value(mod[key])
+    return settings
+
+def get_modifier_summary(mod):
+    summary = {
+        "type": mod.type,
+        "name": mod.name,
+        "show_viewport": mod.show_viewport,
+        "show_render": mod.show_render,
+    }
+    for key in MANIFEST_MODIFIER_FIELDS:
+        if hasattr(mod, key):
+            value = getattr(mod, key)
+            summary[key] = round(value, 6) if isinstance(value, float) else value
+    return summary
+
+def hash_content(base_mesh_hash, obj):
+    # The exported mesh is the base mesh run through the modifier stack
+    digest = hashlib.blake2b(base_mesh_hash.encode(), digest_size=16)
+    stack = [get_modifier_settings(mod) for mod in obj.modifiers]
+    digest.update(json.dumps(stack, sort_keys=True).encode())
+    return digest.hexdigest()
+
+def get_manifest_entry(obj, lp_suffix, hp_suffix, mesh_hashes):
+    matrix = obj.matrix_world
+    location, rotation, scale = matrix.decompose()
+    corners = [matrix @ Vector(corner) for corner in obj.bound_box]
+    counterpart = find_counterpart(obj, lp_suffix, hp_suffix)
+
+    entry = {
+        "name": obj.name,
+        "side": get_pair_side(obj, lp_suffix, hp_suffix),
+        "pair": counterpart.name if counterpart else None,
+        "mesh": None,
+        "base_mesh_hash": None,
+        "content_hash": None,
+        "tris": None,
+        "estimated_tris": None,
+        "location": [round(value, 6) for value in location],
+        "rotation": [round(value, 6) for value in rotation],
+        "scale": [round(value, 6) for value in scale],
+        "bbox_min": [round(min(corner[axis] for corner in corners), 6) for axis in range(3)],
+        "bbox_max": [round(max(corner[axis] for corner in corners), 6) for axis in range(3)],
+        "modifiers": [get_modifier_summary(mod) for mod in obj.modifiers],
+    }
+
+    if obj.type == 'MESH':
+        # base_mesh_hash ignores modifiers, so linked duplicates are hashed
+        # once per export run. content_hash adds the object's modifier stack
+        # and changes whenever the exported mesh can change.
+        mesh = obj.data
+        key = mesh.name_full
+        if key not in mesh_hashes:
+            mesh_hashes[key] = hash_mesh(mesh)
+        entry["mesh"] = key
+        entry["base_mesh_hash"] = mesh_hashes[key]
+        entry["content_hash"] = hash_content(mesh_hashes[key], obj)
+        entry["tris"] = get_mesh_counts(mesh)[2]
+        entry["estimated_tris"] = estimate_evaluated_tris(obj)
+
+    return entry
+
+def write_export_manifest(context, export_objects, filepath, mesh_hashes=None):
+    # One JSON line per object, sorted by name so manifests diff cleanly.
+    # Each line is written to disk as soon as it's built, nothing is held
+    # for the whole set. Called once the FBX is written, chunked exports
+    # produce one manifest per chunk as they go.
+    settings = context.scene.rename_settings
+    if mesh_hashes is None:
+        mesh_hashes = {}
+
+    manifest_path = get_manifest_path(filepath)
+    with open(manifest_path, "w", encoding="utf-8", newline="\n") as f:
+        for obj in sorted(export_objects, key=lambda o: o.name_full):
+            entry = get_manifest_entry(obj, settings.lp_suffix, settings.hp_suffix, mesh_hashes)
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+    return manifest_path
+
+def export_fbx_objects(context, export_objects, filepath, mesh_only=True, exclude_anim=True, mesh_hashes=None):
+    # Objects must already be staged (see stage_export_objects).
+    # Share mesh_hashes between calls of one run so each mesh is hashed once.
+    select_only(context, export_objects)
+
+    object_types = {'MESH'} if mesh_only else {'EMPTY', 'CAMERA', 'LIGHT', 'ARMATURE', 'MESH', 'OTHER'}
+
+    with context.temp_override(selected_objects=list(export_objects)):
+        bpy.ops.export_scene.fbx(
+            filepath=filepath,
+            use_selection=True,
+            object_types=object_types,
+            apply_unit_scale=True,
+            bake_space_transform=True,
+            use_mesh_modifiers=True,
+            add_leaf_bones=False,
+            use_custom_props=False,
+            apply_scale_options='FBX_SCALE_NONE',
+            bake_anim=not exclude_anim
+        )
+
+    select_only(context, [])
+    auto_export_state["dirty"].difference_update(obj.name_full for obj in export_objects)
+
+    # Written once the FBX exists, so a manifest always describes a real file
+    if context.scene.rename_settings.export_manifest:
+        write_export_manifest(context, export_objects, filepath, mesh_hashes)
+
+def get_export_jobs(source, export_dir, membership=None, export_hp=True, export_lp=True, hp_chunk_tris=0):
+    # source is RenameSettings or an ExportPreset (they share property names)
+    # Returns (set type, objects, filepath, mesh only, exclude animation,
+    # chunk tri budget) per set, a budget of 0 means a single FBX
+    jobs = []
+
+    if export_hp:
+        objects = get_mesh_set_objects(source.highpoly_collections, membership)
+        if objects:
+            jobs.append(('HP', objects, os.path.join(export_dir, source.highpoly_filename),
+                         source.export_hp_mesh_only, source.export_hp_exclude_animation, hp_chunk_tris))
+    if export_lp:
+        objects = get_mesh_set_objects(source.lowpoly_collections, membership)
+        if objects:
+            jobs.append(('LP', objects, os.path.join(export_dir, source.lowpoly_filename),
+                         source.export_lp_mesh_only, source.export_lp_exclude_animation, 0))
+
+    return jobs
+
+def get_settings_export_jobs(settings, export_root, membership=None):
+    # The main HP set honors the chunked export settings like the Export High Poly button
+    hp_chunk_tris = settings.export_hp_chunk_tris if settings.export_hp_chunked else 0
+    return get_export_jobs(settings, export_root, membership, hp_chunk_tris=hp_chunk_tris)
+
+def get_preset_export_jobs(preset, export_root, membership=None):
+    export_dir = os.path.join(export_root, preset.subfolder) if preset.subfolder else export_root
+    return get_export_jobs(preset, export_dir, membership, preset.export_hp, preset.export_lp)
+
+def copy_collection_items(source, target):
+    target.clear()
+    for src in source:
+        item = target.add()
+        item.name = src.name
+        item.enabled = src.enabled
+
+def store_settings_in_preset(settings, preset):
+    copy_collection_items(settings.highpoly_collections, preset.highpoly_collections)
+    copy_collection_items(settings.lowpoly_collections, preset.lowpoly_collections)
+    preset.highpoly_filename = settings.highpoly_filename
+    preset.lowpoly_filename = settings.lowpoly_filename
+    preset.export_hp_mesh_only = settings.export_hp_mesh_only
+    preset.export_hp_exclude_animation = settings.export_hp_exclude_animation
+    preset.export_lp_mesh_only = settings.export_lp_mesh_only
+    preset.export_lp_exclude_animation = settings.export_lp_exclude_animation
+
+def load_preset_into_settings(preset, settings):
+    # Keep the current collection lists and only copy the ticked state,
+    # adding entries for collections the preset knows but the list doesn't
+    for source, target in ((preset.highpoly_collections, settings.highpoly_collections),
+                           (preset.lowpoly_collections, settings.lowpoly_collections)):
+        enabled = {item.name: item.enabled for item in source}
+        existing = set()
+        for item in target:
+            item.enabled = enabled.get(item.name, False)
+            existing.add(item.name)
+        for name, state in enabled.items():
+            if name not in existing:
+                item = target.add()
+                item.name = name
+                item.enabled = state
+
+    settings.highpoly_filename = preset.highpoly_filename
+    settings.lowpoly_filename = preset.lowpoly_filename
+    settings.export_hp_mesh_only = preset.export_hp_mesh_only
+    settings.export_hp_exclude_animation = preset.export_hp_exclude_animation
+    settings.export_lp_mesh_only = preset.export_lp_mesh_only
+    settings.export_lp_exclude_animation = preset.export_lp_exclude_animation
+
+def reset_peak_rss():
+    # Linux only: resets VmHWM so the next reading covers a single chunk
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+def get_peak_rss_mb():
+    if sys.platform == 'win32':
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return counters.PeakWorkingSetSize / (1024 * 1024)
+        return None
+
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def partition_by_tri_budget(objects, tri_budget):
+    # Sorted by name so chunk contents are stable between exports.
+    # An object over budget on its own still gets a chunk to itself.
+    chunks = []
+    current = []
+    current_tris = 0
+
+    for obj in sorted(objects, key=lambda o: o.name_full):
+        tris = estimate_evaluated_tris(obj)
+        if current and current_tris + tris > tri_budget:
+            chunks.append((current, current_tris))
+            current = []
+            current_tris = 0
+        current.append(obj)
+        current_tris += tris
+
+    if current:
+        chunks.append((current, current_tris))
+    return chunks
+
+def export_fbx_chunked(context, export_objects, filepath, tri_budget, mesh_only=True, exclude_anim=True):
+    # Each chunk is staged, exported and hidden again on its own so only
+    # one chunk worth of evaluated meshes is alive at a time
+    stem, ext = os.path.splitext(filepath)
+    chunks = partition_by_tri_budget(export_objects, tri_budget)
+    index = {
+        "source": os.path.basename(filepath),
+        "tri_budget": tri_budget,
+        "chunks": [],
+    }
+    mesh_hashes = {}
+    write_manifest = context.scene.rename_settings.export_manifest
+
+    for number, (objects, tris) in enumerate(chunks, start=1):
+        chunk_path = f"{stem}_{number:03d}{ext}"
+        per_chunk_peak = reset_peak_rss()
+        start = time.perf_counter()
+
+        saved_visibility = []
+        temp_collection = stage_export_objects(context, objects, saved_visibility)
+        try:
+            export_fbx_objects(context, objects, chunk_path, mesh_only, exclude_anim, mesh_hashes)
+        finally:
+            restore_export_visibility(saved_visibility)
+            unstage_export_objects(context, temp_collection)
+
+        # Let the depsgraph drop the evaluated copies before the next chunk
+        context.view_layer.update()
+        gc.collect()
+
+        seconds = time.perf_counter() - start
+        peak_rss = get_peak_rss_mb()
+        peak_text = f"{peak_rss:.0f} MB" if peak_rss is not None else "n/a"
+        if not per_chunk_peak:
+            peak_text += " (process peak)"
+        mesh_count = len(group_objects_by_mesh(objects))
+        print(f"Chunk {number}/{len(chunks)}: {format_instance_savings(mesh_count, len(objects))}, ~{tris} tris, "
+              f"peak RSS {peak_text}, {seconds:.2f}s -> {chunk_path}")
+
+        index["chunks"].append({
+            "file": os.path.basename(chunk_path),
+            "manifest": os.path.basename(get_manifest_path(chunk_path)) if write_manifest else None,
+            "objects": [obj.name for obj in objects],
+            "unique_meshes": mesh_count,
+            "estimated_tris": tris,
+            "peak_rss_mb": round(peak_rss, 1) if peak_rss is not None else None,
+            "seconds": round(seconds, 3),
+        })
+
+    index_path = f"{stem}_chunks.json"
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+
+    return index_path, len(chunks)
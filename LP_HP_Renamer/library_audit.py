@@ -0,0 +1,97 @@
+import csv
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import bpy
+
+from .blendfile import read_blend_id_names_safe
+from .pairs import get_pair_name
+
+# Below this many files, spawning worker processes costs more than it saves
+AUDIT_PROCESS_MIN_FILES = 16
+
+def read_library_id_names(path):
+    # Fallback through Blender itself, main thread only
+    with bpy.data.libraries.load(path) as (data_from, data_to):
+        return {
+            "objects": list(data_from.objects),
+            "collections": list(data_from.collections),
+        }
+
+def read_blend_files(paths, workers):
+    # Parsing is CPU bound, so larger libraries go to spawned processes.
+    # They only import the package and blendfile, never bpy.
+    if workers > 1 and len(paths) >= AUDIT_PROCESS_MIN_FILES:
+        try:
+            mp_context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+                chunksize = max(1, len(paths) // (workers * 4))
+                return dict(zip(paths, pool.map(read_blend_id_names_safe, paths, chunksize=chunksize)))
+        except (BrokenProcessPool, OSError) as e:
+            print(f"Audit process pool unavailable ({e}), reading with threads")
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(paths, pool.map(read_blend_id_names_safe, paths)))
+
+def audit_pair_names(names, lp_suffix, hp_suffix):
+    object_names = set(names["objects"])
+    paired = 0
+    missing_hp = []
+    missing_lp = []
+
+    for name in object_names:
+        pair_name = get_pair_name(name, lp_suffix, hp_suffix)
+        if pair_name is None:
+            continue
+        if pair_name in object_names:
+            paired += name.endswith(lp_suffix)
+        elif name.endswith(lp_suffix):
+            missing_hp.append(name)
+        else:
+            missing_lp.append(name)
+
+    return {
+        "objects": len(object_names),
+        "collections": len(names["collections"]),
+        "paired": paired,
+        "missing_hp": sorted(missing_hp),
+        "missing_lp": sorted(missing_lp),
+        "error": None,
+    }
+
+def find_blend_files(root, recursive=True):
+    if recursive:
+        files = [os.path.join(folder, filename)
+                 for folder, _dirs, filenames in os.walk(root)
+                 for filename in filenames if filename.endswith(".blend")]
+    else:
+        files = [os.path.join(root, filename) for filename in os.listdir(root)
+                 if filename.endswith(".blend")]
+    return sorted(os.path.abspath(path) for path in files)
+
+def load_audit_cache(cache_path):
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def write_audit_report(report_path, root, rows):
+    if report_path.lower().endswith(".csv"):
+        with open(report_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["file", "objects", "collections", "paired", "missing_hp", "missing_lp", "error"])
+            for path, result in rows:
+                writer.writerow([
+                    os.path.relpath(path, root), result["objects"], result["collections"], result["paired"],
+                    ";".join(result["missing_hp"]), ";".join(result["missing_lp"]), result["error"] or "",
+                ])
+    else:
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "library": root,
+                "files": [dict(file=os.path.relpath(path, root), **result) for path, result in rows],
+            }, f, indent=2)
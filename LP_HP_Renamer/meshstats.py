@@ -0,0 +1,183 @@
+from array import array
+
+import bpy
+from bpy.app.handlers import persistent
+
+# Mesh name_full -> (verts, polys, tris), entries are dropped by the
+# depsgraph handler when their geometry changes
+_mesh_count_cache = {}
+
+def get_mesh_counts(mesh):
+    key = mesh.name_full
+    counts = _mesh_count_cache.get(key)
+    if counts is None:
+        # Bulk read of the polygon sizes instead of a Python loop per face
+        poly_count = len(mesh.polygons)
+        loop_totals = array('i', [0]) * poly_count
+        mesh.polygons.foreach_get("loop_total", loop_totals)
+        counts = (len(mesh.vertices), poly_count, sum(loop_totals) - 2 * poly_count)
+        _mesh_count_cache[key] = counts
+    return counts
+
+def estimate_evaluated_tris(obj):
+    # Cheap estimate of the exported triangle count, only subdivision
+    # modifiers are taken into account since they dominate HP memory. The
+    # FBX export applies modifiers through the viewport depsgraph, so the
+    # viewport flags and levels are the ones that count.
+    tris = get_mesh_counts(obj.data)[2]
+    for mod in obj.modifiers:
+        if mod.show_viewport and mod.type in {'SUBSURF', 'MULTIRES'}:
+            tris *= 4 ** mod.levels
+    return tris
+
+_collection_stats = {
+    "objects": {},      # object name_full -> (verts, tris, mesh name_full)
+    "collections": {},  # collection name -> rollup of its mesh objects
+    "sets": {},         # 'HP'/'LP' -> rollup of the enabled collections
+    "watched": set(),   # tracked collections and all their children
+}
+
+def make_rollup(object_names):
+    counts = _collection_stats["objects"]
+    return {
+        "objects": object_names,
+        "verts": sum(counts[name][0] for name in object_names),
+        "tris": sum(counts[name][1] for name in object_names),
+        "meshes": len({counts[name][2] for name in object_names}),
+    }
+
+def clear_collection_stats():
+    _collection_stats["objects"] = {}
+    _collection_stats["collections"] = {}
+    _collection_stats["sets"] = {}
+    _collection_stats["watched"] = set()
+
+def rebuild_collection_stats(settings):
+    clear_collection_stats()
+    counts = _collection_stats["objects"]
+    names = {item.name for item in settings.highpoly_collections}
+    names.update(item.name for item in settings.lowpoly_collections)
+
+    for name in names:
+        col = bpy.data.collections.get(name)
+        if not col:
+            continue
+
+        _collection_stats["watched"].add(name)
+        _collection_stats["watched"].update(child.name for child in col.children_recursive)
+
+        members = set()
+        for obj in col.all_objects:
+            if obj.type == 'MESH':
+                key = obj.name_full
+                if key not in counts:
+                    verts, _polys, tris = get_mesh_counts(obj.data)
+                    counts[key] = (verts, tris, obj.data.name_full)
+                members.add(key)
+        _collection_stats["collections"][name] = make_rollup(members)
+
+    update_set_stats(settings)
+
+def update_set_stats(settings):
+    collections = _collection_stats["collections"]
+    for set_type, items in (('HP', settings.highpoly_collections), ('LP', settings.lowpoly_collections)):
+        members = set()
+        for item in items:
+            if item.enabled and item.name in collections:
+                members |= collections[item.name]["objects"]
+        _collection_stats["sets"][set_type] = make_rollup(members)
+
+def update_set_stats_timer():
+    settings = bpy.context.scene.rename_settings
+    if settings.show_collection_stats:
+        update_set_stats(settings)
+    return None
+
+def update_object_stats(obj):
+    # Applies the count difference of one object to every rollup holding it
+    key = obj.name_full
+    counts = _collection_stats["objects"]
+    old_verts, old_tris, old_mesh = counts[key]
+    verts, _polys, tris = get_mesh_counts(obj.data)
+    mesh = obj.data.name_full
+    if (verts, tris, mesh) == (old_verts, old_tris, old_mesh):
+        return
+
+    counts[key] = (verts, tris, mesh)
+    for rollups in (_collection_stats["collections"], _collection_stats["sets"]):
+        for rollup in rollups.values():
+            if key in rollup["objects"]:
+                rollup["verts"] += verts - old_verts
+                rollup["tris"] += tris - old_tris
+                if mesh != old_mesh:
+                    rollup["meshes"] = len({counts[name][2] for name in rollup["objects"]})
+
+def get_tracked_object_count():
+    return len(_collection_stats["objects"])
+
+def get_tracked_mesh_count():
+    return len({counts[2] for counts in _collection_stats["objects"].values()})
+
+def get_collection_stats(name):
+    return _collection_stats["collections"].get(name)
+
+def get_set_stats(set_type):
+    return _collection_stats["sets"].get(set_type)
+
+def format_count(count):
+    if count >= 1000000:
+        return f"{count / 1000000:.1f}M"
+    if count >= 1000:
+        return f"{count / 1000:.1f}k"
+    return str(count)
+
+def format_stats(rollup):
+    if rollup is None:
+        return "-"
+    text = f"{format_count(rollup['tris'])} tris  {format_count(rollup['verts'])} v  {len(rollup['objects'])} obj"
+    if rollup["meshes"] < len(rollup["objects"]):
+        # Linked duplicates: objects share fewer unique meshes
+        text += f" / {rollup['meshes']} mesh"
+    return text
+
+@persistent
+def mesh_counts_depsgraph_update(scene, depsgraph):
+    tracking = scene.rename_settings.show_collection_stats
+    tracked_objects = _collection_stats["objects"]
+    watched = _collection_stats["watched"]
+    changed = []
+    structure_changed = False
+
+    for update in depsgraph.updates:
+        data = update.id.original
+
+        if isinstance(data, bpy.types.Collection):
+            # Objects were linked/unlinked somewhere under a tracked collection
+            if tracking and data.name in watched:
+                structure_changed = True
+            continue
+
+        if not update.is_updated_geometry:
+            continue
+
+        if isinstance(data, bpy.types.Object):
+            if tracking and data.name_full in tracked_objects:
+                changed.append(data)
+            data = data.data
+        if isinstance(data, bpy.types.Mesh):
+            _mesh_count_cache.pop(data.name_full, None)
+
+    if structure_changed:
+        rebuild_collection_stats(scene.rename_settings)
+    else:
+        for obj in changed:
+            update_object_stats(obj)
+
+@persistent
+def mesh_counts_load_post(*_args):
+    _mesh_count_cache.clear()
+    clear_collection_stats()
+
+    settings = bpy.context.scene.rename_settings
+    if settings.show_collection_stats:
+        rebuild_collection_stats(settings)
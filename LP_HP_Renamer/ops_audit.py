@@ -0,0 +1,86 @@
+import json
+import os
+import time
+
+import bpy
+
+# Library Audit
+class OBJECT_OT_AuditLibraryPairs(bpy.types.Operator):
+    bl_idname = "object.audit_library_pairs"
+    bl_label = "Audit Library Pairs"
+    bl_description = "Report unpaired LP/HP objects in every .blend of the library folder without opening them"
+
+    def execute(self, context):
+        from .library_audit import (
+            audit_pair_names,
+            find_blend_files,
+            load_audit_cache,
+            read_blend_files,
+            read_library_id_names,
+            write_audit_report,
+        )
+
+        settings = context.scene.rename_settings
+        lp_suffix = settings.lp_suffix
+        hp_suffix = settings.hp_suffix
+        root = bpy.path.abspath(settings.audit_library_path)
+        report_path = bpy.path.abspath(settings.audit_report_path)
+
+        if not root or not os.path.isdir(root):
+            self.report({'ERROR'}, "Library folder not found.")
+            return {'CANCELLED'}
+        if not report_path:
+            self.report({'ERROR'}, "Report path is not set.")
+            return {'CANCELLED'}
+
+        start = time.perf_counter()
+        cache_path = os.path.splitext(report_path)[0] + ".cache.json"
+        cache = load_audit_cache(cache_path)
+        new_cache = {}
+        results = {}
+        pending = []
+
+        # Unchanged files (same mtime, size and suffixes) reuse their result
+        for path in find_blend_files(root, settings.audit_recursive):
+            stat = os.stat(path)
+            key = [stat.st_mtime_ns, stat.st_size, lp_suffix, hp_suffix]
+            entry = cache.get(path)
+            if entry and entry["key"] == key:
+                results[path] = entry["result"]
+                new_cache[path] = entry
+            else:
+                pending.append((path, key))
+
+        fallback = []
+        workers = settings.audit_workers or os.cpu_count() or 1
+        read = read_blend_files([path for path, _key in pending], workers)
+        for path, key in pending:
+            names, error = read[path]
+            if error is not None:
+                fallback.append((path, key))
+                continue
+            results[path] = audit_pair_names(names, lp_suffix, hp_suffix)
+            new_cache[path] = {"key": key, "result": results[path]}
+
+        # Files the block reader can't parse go through Blender's loader
+        for path, key in fallback:
+            try:
+                names = read_library_id_names(path)
+            except (OSError, RuntimeError) as e:
+                results[path] = {"objects": 0, "collections": 0, "paired": 0,
+                                 "missing_hp": [], "missing_lp": [], "error": str(e)}
+                continue
+            results[path] = audit_pair_names(names, lp_suffix, hp_suffix)
+            new_cache[path] = {"key": key, "result": results[path]}
+
+        rows = sorted(results.items())
+        os.makedirs(os.path.dirname(report_path) or ".", exist_ok=True)
+        write_audit_report(report_path, root, rows)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump(new_cache, f)
+
+        unpaired = sum(1 for _path, result in rows if result["missing_hp"] or result["missing_lp"])
+        errors = sum(1 for _path, result in rows if result["error"])
+        self.report({'INFO'}, f"Audited {len(rows)} file(s) ({len(pending)} read, {len(rows) - len(pending)} cached) "
+                              f"in {time.perf_counter() - start:.1f}s: {unpaired} with missing pairs, {errors} error(s)")
+        return {'FINISHED'}
@@ -0,0 +1,68 @@
+import json
+import os
+import time
+
+import bpy
+
+from .pairs import collect_lp_hp_pairs, find_counterpart, get_pair_side
+
+# Baker
+class OBJECT_OT_BakeLPHPPairs(bpy.types.Operator):
+    bl_idname = "object.bake_lphp_pairs"
+    bl_label = "Bake LP/HP Pairs"
+    bl_description = ("Bake Normal/AO/ID maps with Cycles on the CPU for every LP/HP pair "
+                      "(selected objects, or the whole scene if nothing is selected)")
+
+    def execute(self, context):
+        from .baker import get_enabled_bake_passes, run_bake_session, run_bake_workers
+
+        settings = context.scene.rename_settings
+        export_path = bpy.path.abspath(settings.export_path)
+
+        if not export_path:
+            self.report({'ERROR'}, "Export path is not set.")
+            return {'CANCELLED'}
+        if not get_enabled_bake_passes(settings):
+            self.report({'WARNING'}, "No bake maps enabled")
+            return {'CANCELLED'}
+
+        source = context.selected_objects or context.scene.objects
+
+        # Selecting either side of a pair bakes it, HP objects stand in for their LP
+        lp_objects = {}
+        for obj in source:
+            if get_pair_side(obj, settings.lp_suffix, settings.hp_suffix) == 'HP':
+                obj = find_counterpart(obj, settings.lp_suffix, settings.hp_suffix) or obj
+            lp_objects.setdefault(obj.name_full, obj)
+        pairs = collect_lp_hp_pairs(lp_objects.values(), settings.lp_suffix, settings.hp_suffix)
+        if not pairs:
+            self.report({'WARNING'}, "No valid LP/HP pairs found")
+            return {'CANCELLED'}
+
+        out_dir = os.path.join(export_path, settings.bake_subfolder)
+        os.makedirs(out_dir, exist_ok=True)
+
+        start = time.perf_counter()
+        workers = min(settings.bake_workers, len(pairs))
+        if workers > 1:
+            results = run_bake_workers(context, pairs, out_dir, workers)
+        else:
+            results = run_bake_session(context, settings, pairs, out_dir)
+        seconds = time.perf_counter() - start
+
+        report = {
+            "passes": get_enabled_bake_passes(settings),
+            "resolution": settings.bake_resolution,
+            "workers": workers,
+            "seconds": round(seconds, 3),
+            "pairs": results,
+        }
+        with open(os.path.join(out_dir, "bake_report.json"), "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+        failed = [result["pair"] for result in results if result["error"]]
+        if failed:
+            self.report({'WARNING'}, f"Baked {len(results) - len(failed)}/{len(results)} pair(s) in {seconds:.1f}s, failed: {', '.join(failed)}")
+        else:
+            self.report({'INFO'}, f"Baked {len(results)} pair(s) in {seconds:.1f}s")
+        return {'FINISHED'}
@@ -0,0 +1,305 @@
+import os
+import time
+
+import bpy
+
+from . import meshstats
+from .utils import format_instance_savings, get_all_objects_from_collection, get_mesh_set_objects
+
+# Collection Exporter
+class OBJECT_OT_RefreshExportCollections(bpy.types.Operator):
+    bl_idname = "object.refresh_export_collections"
+    bl_label = "Refresh Export Collections"
+    bl_description = "Refresh the list of collections for export"
+
+    def execute(self, context):
+        settings = context.scene.rename_settings
+        settings.highpoly_collections.clear()
+        settings.lowpoly_collections.clear()
+
+        for col in bpy.data.collections:
+            item_hp = settings.highpoly_collections.add()
+            item_hp.name = col.name
+            item_hp.enabled = False
+
+            item_lp = settings.lowpoly_collections.add()
+            item_lp.name = col.name
+            item_lp.enabled = False
+
+        if settings.show_collection_stats:
+            meshstats.rebuild_collection_stats(settings)
+
+        self.report({'INFO'}, "Refreshed collection lists.")
+        return {'FINISHED'}
+
+class OBJECT_OT_ExportSelectedMeshSets(bpy.types.Operator):
+    bl_idname = "export_collections.export_mesh_set"
+    bl_label = "Export Mesh Set"
+    bl_description = "Export selected mesh collections (HP or LP) as a single FBX"
+
+    type: bpy.props.EnumProperty(
+        name="Set Type",
+        items=[
+            ('HP', "High Poly", "Export High Poly set"),
+            ('LP', "Low Poly", "Export Low Poly set")
+        ],
+        default='HP'
+    )
+
+    def execute(self, context):
+        from .exporter import export_fbx_chunked, export_fbx_objects, stage_export_objects, unstage_export_objects
+
+        settings = context.scene.rename_settings
+
+        export_path = bpy.path.abspath(settings.export_path)
+        export_filename = settings.highpoly_filename if self.type == 'HP' else settings.lowpoly_filename
+        full_export_path = os.path.join(export_path, export_filename)
+
+        collection_list = (
+            settings.highpoly_collections if self.type == 'HP'
+            else settings.lowpoly_collections
+        )
+
+        export_objects = get_mesh_set_objects(collection_list)
+
+        if not export_objects:
+            self.report({'WARNING'}, "No mesh objects found in selected collections.")
+            return {'CANCELLED'}
+
+        mesh_only = settings.export_hp_mesh_only if self.type == 'HP' else settings.export_lp_mesh_only
+        exclude_anim = settings.export_hp_exclude_animation if self.type == 'HP' else settings.export_lp_exclude_animation
+
+        if self.type == 'HP' and settings.export_hp_chunked:
+            index_path, chunk_count = export_fbx_chunked(
+                context, export_objects, full_export_path,
+                settings.export_hp_chunk_tris, mesh_only, exclude_anim
+            )
+            self.report({'INFO'}, f"Exported HP mesh set in {chunk_count} chunk(s), index: {os.path.basename(index_path)}")
+            return {'FINISHED'}
+
+        temp_collection = stage_export_objects(context, export_objects)
+        try:
+            export_fbx_objects(context, export_objects, full_export_path, mesh_only, exclude_anim)
+        finally:
+            unstage_export_objects(context, temp_collection)
+
+        self.report({'INFO'}, f"Exported {self.type} mesh set to {export_filename}")
+        return {'FINISHED'}
+
+class OBJECT_OT_RefreshCollectionStats(bpy.types.Operator):
+    bl_idname = "object.refresh_collection_stats"
+    bl_label = "Refresh Stats"
+    bl_description = "Recount tris/verts/objects of the HP/LP export collections"
+
+    def execute(self, context):
+        settings = context.scene.rename_settings
+        start = time.perf_counter()
+        meshstats.rebuild_collection_stats(settings)
+        savings = format_instance_savings(meshstats.get_tracked_mesh_count(), meshstats.get_tracked_object_count())
+        self.report({'INFO'}, f"Counted {savings} in {time.perf_counter() - start:.3f}s")
+        return {'FINISHED'}
+
+# Export Presets
+class EXPORT_UL_Presets(bpy.types.UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.prop(item, "enabled", text="")
+        row.prop(item, "name", text="", emboss=False, icon='PRESET')
+
+class OBJECT_OT_AddExportPreset(bpy.types.Operator):
+    bl_idname = "export_collections.add_preset"
+    bl_label = "Add Export Preset"
+    bl_description = "Save the current HP/LP collections, filenames and flags as a new preset"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        from .exporter import store_settings_in_preset
+
+        settings = context.scene.rename_settings
+
+        preset = settings.export_presets.add()
+        preset.name = settings.base_name or f"Preset {len(settings.export_presets)}"
+        store_settings_in_preset(settings, preset)
+        settings.active_preset_index = len(settings.export_presets) - 1
+
+        self.report({'INFO'}, f"Added preset '{preset.name}'")
+        return {'FINISHED'}
+
+class OBJECT_OT_RemoveExportPreset(bpy.types.Operator):
+    bl_idname = "export_collections.remove_preset"
+    bl_label = "Remove Export Preset"
+    bl_description = "Remove the active export preset"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        settings = context.scene.rename_settings
+        index = settings.active_preset_index
+
+        if not 0 <= index < len(settings.export_presets):
+            self.report({'WARNING'}, "No preset selected")
+            return {'CANCELLED'}
+
+        name = settings.export_presets[index].name
+        settings.export_presets.remove(index)
+        settings.active_preset_index = min(index, len(settings.export_presets) - 1)
+
+        self.report({'INFO'}, f"Removed preset '{name}'")
+        return {'FINISHED'}
+
+class OBJECT_OT_StoreExportPreset(bpy.types.Operator):
+    bl_idname = "export_collections.store_preset"
+    bl_label = "Store in Preset"
+    bl_description = "Overwrite the active preset with the current HP/LP collections, filenames and flags"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        settings = context.scene.rename_settings
+        index = settings.active_preset_index
+
+        if not 0 <= index < len(settings.export_presets):
+            self.report({'WARNING'}, "No preset selected")
+            return {'CANCELLED'}
+
+        from .exporter import store_settings_in_preset
+
+        preset = settings.export_presets[index]
+        store_settings_in_preset(settings, preset)
+
+        self.report({'INFO'}, f"Stored current settings in '{preset.name}'")
+        return {'FINISHED'}
+
+class OBJECT_OT_LoadExportPreset(bpy.types.Operator):
+    bl_idname = "export_collections.load_preset"
+    bl_label = "Load Preset"
+    bl_description = "Tick the HP/LP collections and restore filenames and flags from the active preset"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        settings = context.scene.rename_settings
+        index = settings.active_preset_index
+
+        if not 0 <= index < len(settings.export_presets):
+            self.report({'WARNING'}, "No preset selected")
+            return {'CANCELLED'}
+
+        from .exporter import load_preset_into_settings
+
+        preset = settings.export_presets[index]
+        load_preset_into_settings(preset, settings)
+
+        self.report({'INFO'}, f"Loaded preset '{preset.name}'")
+        return {'FINISHED'}
+
+class OBJECT_OT_ExportAllPresets(bpy.types.Operator):
+    bl_idname = "export_collections.export_all_presets"
+    bl_label = "Export All Presets"
+    bl_description = "Export the HP/LP sets of every enabled preset in one pass"
+
+    def execute(self, context):
+        from .exporter import export_fbx_objects, get_preset_export_jobs, stage_export_objects, unstage_export_objects
+
+        settings = context.scene.rename_settings
+        export_root = bpy.path.abspath(settings.export_path)
+
+        if not export_root:
+            self.report({'ERROR'}, "Export path is not set.")
+            return {'CANCELLED'}
+
+        # Collection membership is resolved once and shared by all presets
+        membership = {}
+        jobs = []
+        for preset in settings.export_presets:
+            if preset.enabled:
+                jobs.extend(get_preset_export_jobs(preset, export_root, membership))
+
+        if not jobs:
+            self.report({'WARNING'}, "No enabled preset has mesh objects to export.")
+            return {'CANCELLED'}
+
+        # Stage the union of all sets once. Staging links/unhides objects,
+        # which dirties the depsgraph; doing it per export would force a
+        # re-evaluation of every modifier stack for each file. After one
+        # evaluation here, exports only change selection and reuse the
+        # evaluated meshes.
+        all_objects = {}
+        for _set_type, objects, _path, _mesh_only, _exclude_anim, _chunk_tris in jobs:
+            for obj in objects:
+                all_objects.setdefault(obj.name_full, obj)
+
+        temp_collection = stage_export_objects(context, all_objects.values())
+        try:
+            context.evaluated_depsgraph_get()
+
+            # Presets sharing objects hash each mesh for their manifests once
+            mesh_hashes = {}
+            for set_type, objects, filepath, mesh_only, exclude_anim, _chunk_tris in jobs:
+                os.makedirs(os.path.dirname(filepath), exist_ok=True)
+                export_fbx_objects(context, objects, filepath, mesh_only, exclude_anim, mesh_hashes)
+                print(f"Exported {set_type} set ({len(objects)} objects) to {filepath}")
+        finally:
+            unstage_export_objects(context, temp_collection)
+
+        self.report({'INFO'}, f"Exported {len(jobs)} mesh set(s) from {len(all_objects)} object(s)")
+        return {'FINISHED'}
+
+class OBJECT_OT_ExportSelectedCollections(bpy.types.Operator):
+    bl_idname = "object.export_selected_collections"
+    bl_label = "Export Selected Collections"
+    bl_description = "Export all mesh objects in selected collections as a single FBX file"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        # Ensure that we're working in a valid context
+        settings = bpy.context.scene.rename_settings  # Access scene rename settings
+        export_path = bpy.path.abspath(settings.export_path)
+
+        if not export_path:
+            self.report({'ERROR'}, "Export path is not set.")
+            return {'CANCELLED'}
+
+        # Collect selected collections based on checkbox list
+        selected_collections = [
+            bpy.data.collections.get(item.name)
+            for item in settings.export_collections if item.include
+        ]
+
+        if not selected_collections:
+            self.report({'ERROR'}, "No collections selected for export.")
+            return {'CANCELLED'}
+
+        # Collect all mesh objects from selected collections
+        all_mesh_objects = []
+        for col in selected_collections:
+            for obj in get_all_objects_from_collection(col):
+                if obj.type == 'MESH' and obj not in all_mesh_objects:
+                    all_mesh_objects.append(obj)
+
+        if not all_mesh_objects:
+            self.report({'WARNING'}, "No mesh objects found in selected collections.")
+            return {'CANCELLED'}
+
+        # Prepare for export
+        bpy.ops.object.select_all(action='DESELECT')
+        for obj in all_mesh_objects:
+            obj.select_set(True)
+        context.view_layer.objects.active = all_mesh_objects[0]
+
+        # Use the first collection's name as filename
+        export_filename = selected_collections[0].name + ".fbx"
+        full_export_path = os.path.join(export_path, export_filename)
+
+        # Export as FBX
+        bpy.ops.export_scene.fbx(
+            filepath=full_export_path,
+            use_selection=True,
+            apply_unit_scale=True,
+            bake_space_transform=True,
+            object_types={'MESH'},
+            mesh_smooth_type='OFF',
+            use_mesh_modifiers=True,
+            add_leaf_bones=False,
+            path_mode='AUTO',
+        )
+
+        self.report({'INFO'}, f"Exported to {full_export_path}")
+        return {'FINISHED'}
@@ -0,0 +1,96 @@
+import bpy
+
+# Weighted Normalizer
+class OBJECT_OT_AddWeightedNormal(bpy.types.Operator):
+    bl_idname = "object.add_weighted_normal"
+    bl_label = "Add Weighted Normal"
+    bl_description = "Add Weighted Normal modifier with Keep Sharp to selected objects"
+
+    def execute(self, context):
+        added = 0
+        for obj in context.selected_objects:
+            if obj.type == 'MESH':
+                if not any(mod.type == 'WEIGHTED_NORMAL' for mod in obj.modifiers):
+                    mod = obj.modifiers.new(name="WeightedNormal", type='WEIGHTED_NORMAL')
+                    mod.keep_sharp = True
+                    added += 1
+        self.report({'INFO'}, f"Added Weighted Normal to {added} object(s).")
+        return {'FINISHED'}
+
+class OBJECT_OT_DelWeightedNormal(bpy.types.Operator):
+    bl_idname = "object.del_weighted_normal"
+    bl_label = "Delete Weighted Normal"
+    bl_description = "Delete Weighted Normal modifier from selected objects"
+
+    def execute(self, context):
+        deleted = 0
+        for obj in context.selected_objects:
+            if obj.type == 'MESH':
+                for mod in obj.modifiers:
+                    if mod.type == 'WEIGHTED_NORMAL':
+                        obj.modifiers.remove(mod)
+                        deleted += 1
+                        break  # Delete only one per object
+        self.report({'INFO'}, f"Deleted Weighted Normal from {deleted} object(s).")
+        return {'FINISHED'}
+
+class OBJECT_OT_VerifyWeightedNormal(bpy.types.Operator):
+    bl_idname = "object.verify_weighted_normal"
+    bl_label = "Verify Weighted Normal"
+    bl_description = "Check if selected objects have a Weighted Normal modifier"
+
+    def execute(self, context):
+        missing = []
+        for obj in context.selected_objects:
+            if obj.type == 'MESH':
+                if not any(mod.type == 'WEIGHTED_NORMAL' for mod in obj.modifiers):
+                    missing.append(obj.name)
+        if missing:
+            self.report({'WARNING'}, f"Missing Weighted Normal: {', '.join(missing)}")
+        else:
+            self.report({'INFO'}, "All selected objects have Weighted Normal.")
+        return {'FINISHED'}
+
+class OBJECT_OT_EnableKeepSharp(bpy.types.Operator):
+    bl_idname = "object.enable_keep_sharp"
+    bl_label = "Enable Keep Sharp"
+    bl_description = "Enable Keep Sharp for Weighted Normal modifiers in selected objects"
+
+    def execute(self, context):
+        count = 0
+        for obj in context.selected_objects:
+            for mod in obj.modifiers:
+                if mod.type == 'WEIGHTED_NORMAL':
+                    mod.keep_sharp = True
+                    count += 1
+        self.report({'INFO'}, f"Enabled Keep Sharp on {count} modifier(s).")
+        return {'FINISHED'}
+
+class OBJECT_OT_DisableKeepSharp(bpy.types.Operator):
+    bl_idname = "object.disable_keep_sharp"
+    bl_label = "Disable Keep Sharp"
+    bl_description = "Disable Keep Sharp for Weighted Normal modifiers in selected objects"
+
+    def execute(self, context):
+        count = 0
+        for obj in context.selected_objects:
+            for mod in obj.modifiers:
+                if mod.type == 'WEIGHTED_NORMAL':
+                    mod.keep_sharp = False
+                    count += 1
+        self.report({'INFO'}, f"Disabled Keep Sharp on {count} modifier(s).")
+        return {'FINISHED'}
+
+class OBJECT_OT_ToggleWireOverlay(bpy.types.Operator):
+    bl_idname = "object.toggle_wire_overlay"
+    bl_label = "Toggle Wireframe Overlay"
+    bl_description = "Toggle 'show wire' overlay for selected mesh objects"
+
+    def execute(self, context):
+        toggled = 0
+        for obj in context.selected_objects:
+            if obj.type == 'MESH':
+                obj.show_wire = not obj.show_wire
+                toggled += 1
+        self.report({'INFO'}, f"Toggled wire overlay on {toggled} object(s).")
+        return {'FINISHED'}
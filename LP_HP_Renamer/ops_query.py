@@ -0,0 +1,41 @@
+import time
+
+import bpy
+
+from .utils import select_only
+
+# Selection Query
+class OBJECT_OT_SelectByQuery(bpy.types.Operator):
+    bl_idname = "object.select_by_query"
+    bl_label = "Select Matching"
+    bl_description = ("Select the visible objects matching the query, "
+                      "so any other tool can run on the result")
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        from .query import run_query
+
+        settings = context.scene.rename_settings
+        objects = [obj for obj in context.view_layer.objects if obj.visible_get()]
+
+        try:
+            matches, timings = run_query(settings.query_text, objects, settings.lp_suffix, settings.hp_suffix)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+
+        # Selection is set directly on the objects, no select_all operator round trips
+        start = time.perf_counter()
+        if settings.query_extend:
+            for obj in matches:
+                obj.select_set(True)
+        else:
+            select_only(context, matches)
+        if matches:
+            context.view_layer.objects.active = matches[0]
+        select_ms = (time.perf_counter() - start) * 1000.0
+
+        self.report({'INFO'}, f"Matched {len(matches)} of {len(objects)} object(s): "
+                              f"parse {timings['parse'] * 1000.0:.1f} ms, "
+                              f"evaluate {timings['evaluate'] * 1000.0:.1f} ms, select {select_ms:.1f} ms")
+        return {'FINISHED'}
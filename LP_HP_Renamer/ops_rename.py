@@ -0,0 +1,409 @@
+import time
+
+import bpy
+
+from .meshstats import get_mesh_counts
+from .pairs import find_counterpart, get_linked_pair, get_pair_name, get_pair_side, is_in_scene, link_pair
+from .utils import select_only
+
+# Renamer
+class OBJECT_OT_RenameLPHP(bpy.types.Operator):
+    bl_idname = "object.rename_lphp"
+    bl_label = "Rename LP/HP"
+    bl_description = "Rename two selected objects with LP/HP suffix based on polycount"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        settings = context.scene.rename_settings
+        selected = context.selected_objects
+
+        if len(selected) != 2:
+            self.report({'ERROR'}, "Select exactly 2 objects")
+            return {'CANCELLED'}
+
+        obj1, obj2 = selected
+        if obj1.type != 'MESH' or obj2.type != 'MESH':
+            self.report({'ERROR'}, "Both selected objects must be meshes")
+            return {'CANCELLED'}
+
+        # Counted once per mesh datablock and cached, so linked duplicates
+        # and repeated renames don't walk the polygons again
+        tris1 = get_mesh_counts(obj1.data)[2]
+        tris2 = get_mesh_counts(obj2.data)[2]
+
+        if tris1 <= tris2:
+            lp_obj, hp_obj = obj1, obj2
+        else:
+            lp_obj, hp_obj = obj2, obj1
+
+        new_lp_name = settings.base_name + settings.lp_suffix
+        new_hp_name = settings.base_name + settings.hp_suffix
+
+        # Check for name collisions in other objects (not the selected ones)
+        for obj in bpy.data.objects:
+            if obj not in (lp_obj, hp_obj):
+                if obj.name == new_lp_name or obj.name == new_hp_name:
+                    self.report({'ERROR'}, f"Name '{obj.name}' already exists in the scene.")
+                    return {'CANCELLED'}
+
+        lp_obj.name = new_lp_name
+        hp_obj.name = new_hp_name
+        link_pair(lp_obj, hp_obj)
+
+        self.report({'INFO'}, f"Renamed to: {lp_obj.name}, {hp_obj.name}")
+        return {'FINISHED'}
+
+class OBJECT_OT_SwapLPHP(bpy.types.Operator):
+    bl_idname = "object.swap_lphp"
+    bl_label = "Swap LP/HP (Legacy)"
+    bl_description = "Swap LP and HP suffixes and collection positions of selected objects"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        settings = context.scene.rename_settings
+        selected = context.selected_objects
+
+        lp_suffix = settings.lp_suffix
+        hp_suffix = settings.hp_suffix
+
+        def ends_with(obj, suffix):
+            return obj.name.endswith(suffix)
+
+        def strip_suffix(name, suffix):
+            if name.endswith(suffix):
+                return name[:-len(suffix)]
+            return None
+
+        if len(selected) == 1:
+            obj = selected[0]
+            side = get_pair_side(obj, lp_suffix, hp_suffix)
+            if side == 'NONE':
+                self.report({'ERROR'}, f"Object name must end with '{lp_suffix}' or '{hp_suffix}'")
+                return {'CANCELLED'}
+
+            counterpart = find_counterpart(obj, lp_suffix, hp_suffix)
+            if not counterpart:
+                self.report({'ERROR'}, f"Matching {'HP' if side == 'LP' else 'LP'} object for '{obj.name}' not found.")
+                return {'CANCELLED'}
+            lp_obj, hp_obj = (obj, counterpart) if side == 'LP' else (counterpart, obj)
+
+        elif len(selected) == 2:
+            obj1, obj2 = selected
+            if get_linked_pair(obj1) == obj2:
+                lp_obj, hp_obj = (obj1, obj2) if obj1.lphp_side == 'LP' else (obj2, obj1)
+            elif ends_with(obj1, lp_suffix) and ends_with(obj2, hp_suffix):
+                lp_obj, hp_obj = obj1, obj2
+            elif ends_with(obj2, lp_suffix) and ends_with(obj1, hp_suffix):
+                lp_obj, hp_obj = obj2, obj1
+            else:
+                self.report({'ERROR'}, f"Objects must end with '{lp_suffix}' and '{hp_suffix}'")
+                return {'CANCELLED'}
+
+            if (get_linked_pair(lp_obj) != hp_obj and
+                    strip_suffix(lp_obj.name, lp_suffix) != strip_suffix(hp_obj.name, hp_suffix)):
+                self.report({'ERROR'}, "Base names do not match")
+                return {'CANCELLED'}
+        else:
+            self.report({'ERROR'}, "Select 1 or 2 objects")
+            return {'CANCELLED'}
+
+        # Linked objects may have been renamed, take the base from either side
+        base = strip_suffix(lp_obj.name, lp_suffix)
+        if base is None:
+            base = strip_suffix(hp_obj.name, hp_suffix)
+        if base is None:
+            self.report({'ERROR'}, f"Neither '{lp_obj.name}' nor '{hp_obj.name}' has an LP/HP suffix")
+            return {'CANCELLED'}
+
+        # Check for name conflicts
+        new_lp_name = base + hp_suffix
+        new_hp_name = base + lp_suffix
+
+        for obj in bpy.data.objects:
+            if obj not in (lp_obj, hp_obj):
+                if obj.name in (new_lp_name, new_hp_name):
+                    self.report({'ERROR'}, f"Name '{obj.name}' already exists in the scene.")
+                    return {'CANCELLED'}
+
+        # Swap collections
+        lp_cols = [col for col in lp_obj.users_collection]
+        hp_cols = [col for col in hp_obj.users_collection]
+
+        for col in lp_cols:
+            col.objects.unlink(lp_obj)
+        for col in hp_cols:
+            col.objects.unlink(hp_obj)
+        for col in lp_cols:
+            col.objects.link(hp_obj)
+        for col in hp_cols:
+            col.objects.link(lp_obj)
+
+        # Use temp names to avoid conflicts
+        lp_obj.name = "__TEMP_SWAP_LP__"
+        hp_obj.name = "__TEMP_SWAP_HP__"
+
+        lp_obj.name = new_lp_name
+        hp_obj.name = new_hp_name
+
+        # The old LP now carries the HP name and collections
+        link_pair(hp_obj, lp_obj)
+
+        self.report({'INFO'}, f"Swapped: {lp_obj.name} <--> {hp_obj.name}")
+        return {'FINISHED'}
+
+class OBJECT_OT_SwapLPHPNames(bpy.types.Operator):
+    bl_idname = "object.swap_lphp_names"
+    bl_label = "Swap LP/HP Names"
+    bl_description = "Rename LP and HP objects based on polycount"
+
+    def execute(self, context):
+        settings = context.scene.rename_settings
+        selected = context.selected_objects
+        lp_suffix = settings.lp_suffix
+        hp_suffix = settings.hp_suffix
+
+        def strip_suffix(name):
+            for suffix in (lp_suffix, hp_suffix):
+                if name.endswith(suffix):
+                    return name[:-len(suffix)]
+            return None
+
+        def get_pair(obj):
+            counterpart = find_counterpart(obj, lp_suffix, hp_suffix)
+            base = strip_suffix(obj.name) or (strip_suffix(counterpart.name) if counterpart else None)
+            if not (counterpart and base):
+                return None, None, None
+
+            if get_pair_side(obj, lp_suffix, hp_suffix) == 'LP':
+                return obj, counterpart, base
+            return counterpart, obj, base
+
+        if len(selected) == 1:
+            lp_obj, hp_obj, base = get_pair(selected[0])
+            if not (lp_obj and hp_obj):
+                self.report({'ERROR'}, "Could not find both LP and HP objects for selected object.")
+                return {'CANCELLED'}
+
+        elif len(selected) == 2:
+            obj1, obj2 = selected
+            base1 = strip_suffix(obj1.name)
+            base2 = strip_suffix(obj2.name)
+            if get_linked_pair(obj1) == obj2 and (base1 or base2):
+                base = base1 or base2
+            elif base1 != base2 or not base1:
+                self.report({'ERROR'}, "Selected objects must share the same base name.")
+                return {'CANCELLED'}
+            else:
+                base = base1
+            poly1 = len(obj1.data.polygons)
+            poly2 = len(obj2.data.polygons)
+            lp_obj, hp_obj = (obj1, obj2) if poly1 < poly2 else (obj2, obj1)
+        else:
+            self.report({'ERROR'}, "Select 1 or 2 objects.")
+            return {'CANCELLED'}
+
+        # Prepare final names
+        new_lp_name = base + lp_suffix
+        new_hp_name = base + hp_suffix
+
+        # Check for name conflicts (exclude self)
+        for obj in bpy.data.objects:
+            if obj not in (lp_obj, hp_obj) and obj.name in (new_lp_name, new_hp_name):
+                self.report({'ERROR'}, f"Name '{obj.name}' already exists.")
+                return {'CANCELLED'}
+
+        # Rename only if needed
+        if lp_obj.name != new_lp_name:
+            lp_obj.name = new_lp_name
+        if hp_obj.name != new_hp_name:
+            hp_obj.name = new_hp_name
+        link_pair(lp_obj, hp_obj)
+
+        self.report({'INFO'}, f"Renamed: {lp_obj.name} / {hp_obj.name}")
+        return {'FINISHED'}
+
+class OBJECT_OT_SwapLPHPCollections(bpy.types.Operator):
+    bl_idname = "object.swap_lphp_collections"
+    bl_label = "Swap LP/HP Collections"
+    bl_description = "Swap collections of LP and HP objects"
+
+    def execute(self, context):
+        settings = context.scene.rename_settings
+        selected = context.selected_objects
+        lp_suffix = settings.lp_suffix
+        hp_suffix = settings.hp_suffix
+
+        def strip_suffix(name, suffix):
+            return name[:-len(suffix)] if name.endswith(suffix) else None
+
+        if len(selected) == 1:
+            obj = selected[0]
+            side = get_pair_side(obj, lp_suffix, hp_suffix)
+            if side == 'NONE':
+                self.report({'ERROR'}, "Object name must end with LP or HP suffix")
+                return {'CANCELLED'}
+            counterpart = find_counterpart(obj, lp_suffix, hp_suffix)
+            if not counterpart:
+                self.report({'ERROR'}, f"Matching {'HP' if side == 'LP' else 'LP'} object not found.")
+                return {'CANCELLED'}
+            lp_obj, hp_obj = (obj, counterpart) if side == 'LP' else (counterpart, obj)
+        elif len(selected) == 2:
+            obj1, obj2 = selected
+            if get_linked_pair(obj1) == obj2:
+                lp_obj, hp_obj = (obj1, obj2) if obj1.lphp_side == 'LP' else (obj2, obj1)
+            else:
+                base1 = strip_suffix(obj1.name, lp_suffix) or strip_suffix(obj1.name, hp_suffix)
+                base2 = strip_suffix(obj2.name, lp_suffix) or strip_suffix(obj2.name, hp_suffix)
+                if base1 != base2:
+                    self.report({'ERROR'}, "Objects must share the same base name")
+                    return {'CANCELLED'}
+                lp_obj, hp_obj = (obj1, obj2) if obj1.name.endswith(lp_suffix) else (obj2, obj1)
+        else:
+            self.report({'ERROR'}, "Select 1 or 2 objects")
+            return {'CANCELLED'}
+
+        lp_cols = [col for col in lp_obj.users_collection]
+        hp_cols = [col for col in hp_obj.users_collection]
+
+        for col in lp_cols:
+            col.objects.unlink(lp_obj)
+        for col in hp_cols:
+            col.objects.unlink(hp_obj)
+        for col in lp_cols:
+            col.objects.link(hp_obj)
+        for col in hp_cols:
+            col.objects.link(lp_obj)
+
+        self.report({'INFO'}, f"Swapped collections for {lp_obj.name} and {hp_obj.name}")
+        return {'FINISHED'}
+
+class OBJECT_OT_VerifyLPPairs(bpy.types.Operator):
+    bl_idname = "object.verify_lp_pairs"
+    bl_label = "Verify LP/HP Pairs"
+    bl_description = "Check if selected objects have their LP/HP counterparts"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        settings = context.scene.rename_settings
+        lp_suffix = settings.lp_suffix
+        hp_suffix = settings.hp_suffix
+        selected = context.selected_objects
+
+        if not selected:
+            self.report({'WARNING'}, "No objects selected")
+            return {'CANCELLED'}
+
+        missing_pairs = []
+        verified_pairs = []
+        ignored_objects = []
+
+        for obj in selected:
+            if get_pair_side(obj, lp_suffix, hp_suffix) == 'NONE':
+                ignored_objects.append(obj.name)
+            elif find_counterpart(obj, lp_suffix, hp_suffix):
+                verified_pairs.append(obj.name)
+            else:
+                missing_pairs.append(obj.name)
+
+        msg_parts = []
+
+        if verified_pairs:
+            msg_parts.append(f"✔ Paired: {', '.join(verified_pairs)}")
+        if missing_pairs:
+            msg_parts.append(f"✘ Missing pairs: {', '.join(missing_pairs)}")
+        if ignored_objects:
+            msg_parts.append(f"⚠ No suffix: {', '.join(ignored_objects)}")
+
+        full_msg = " | ".join(msg_parts)
+        self.report({'INFO'}, full_msg if full_msg else "No matching LP/HP suffixes found.")
+        return {'FINISHED'}
+
+class OBJECT_OT_RebuildPairLinks(bpy.types.Operator):
+    bl_idname = "object.rebuild_pair_links"
+    bl_label = "Rebuild Pair Links"
+    bl_description = "Link every LP/HP pair found by name (selected objects, or all objects if nothing is selected)"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        settings = context.scene.rename_settings
+        lp_suffix = settings.lp_suffix
+        hp_suffix = settings.hp_suffix
+        start = time.perf_counter()
+
+        linked = 0
+        for obj in context.selected_objects or bpy.data.objects:
+            if not obj.name.endswith(lp_suffix):
+                continue
+            hp_obj = bpy.data.objects.get(obj.name[:-len(lp_suffix)] + hp_suffix)
+            if hp_obj and get_linked_pair(obj) != hp_obj:
+                link_pair(obj, hp_obj)
+                linked += 1
+
+        self.report({'INFO'}, f"Linked {linked} pair(s) in {time.perf_counter() - start:.3f}s")
+        return {'FINISHED'}
+
+class OBJECT_OT_CheckPairLinks(bpy.types.Operator):
+    bl_idname = "object.check_pair_links"
+    bl_label = "Check Pair Links"
+    bl_description = "Check stored LP/HP links against each other and the object names, and select broken ones"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        settings = context.scene.rename_settings
+        lp_suffix = settings.lp_suffix
+        hp_suffix = settings.hp_suffix
+        start = time.perf_counter()
+
+        linked = 0
+        broken = []        # link not returned or both sides the same
+        deleted = []       # partner was deleted but is kept alive by the link
+        renamed = []       # linked, but names no longer follow the suffixes
+        unlinked = []      # name has a counterpart but no link was stored
+
+        for obj in bpy.data.objects:
+            if not is_in_scene(obj):
+                continue
+            if obj.lphp_pair:
+                other = get_linked_pair(obj)
+                if not other:
+                    (broken if is_in_scene(obj.lphp_pair) else deleted).append(obj)
+                    continue
+                linked += 1
+                if obj.lphp_side == 'LP' and get_pair_name(obj.name, lp_suffix, hp_suffix) != other.name:
+                    renamed.append(obj)
+            elif obj.name.endswith(lp_suffix) and find_counterpart(obj, lp_suffix, hp_suffix):
+                unlinked.append(obj)
+
+        problems = broken + deleted + renamed + unlinked
+        view_layer_objects = context.view_layer.objects
+        select_only(context, [obj for obj in problems if obj.name in view_layer_objects])
+
+        msg = (f"{linked // 2} linked pair(s), {len(broken)} broken, {len(deleted)} partner(s) deleted, {len(renamed)} renamed, "
+               f"{len(unlinked)} unlinked ({time.perf_counter() - start:.3f}s)")
+        self.report({'WARNING'} if problems else {'INFO'}, msg)
+        return {'FINISHED'}
+
+# Find and Replace
+class OBJECT_OT_FindReplaceNames(bpy.types.Operator):
+    bl_idname = "object.find_replace_names"
+    bl_label = "Find & Replace"
+    bl_description = "Find and replace in names of selected objects"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        settings = context.scene.rename_settings
+        find = settings.find_text
+        replace = settings.replace_text
+
+        if not find:
+            self.report({'WARNING'}, "Nothing to find")
+            return {'CANCELLED'}
+
+        count = 0
+        for obj in context.selected_objects:
+            if find in obj.name:
+                obj.name = obj.name.replace(find, replace)
+                count += 1
+
+        self.report({'INFO'}, f"Replaced in {count} object(s)")
+        return {'FINISHED'}
@@ -0,0 +1,159 @@
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import bpy
+
+from .utils import format_instance_savings, get_mesh_set_objects, group_objects_by_mesh, select_only
+
+# LP UV Checker
+class LPHP_UL_UVCheckResults(bpy.types.UIList):
+    sort_key: bpy.props.EnumProperty(
+        name="Sort By",
+        items=[
+            ('NAME', "Name", "Sort by object name"),
+            ('texel_density', "Texel Density", "Sort by texel density"),
+            ('flipped', "Flipped", "Sort by flipped faces"),
+            ('out_of_bounds', "Out of Bounds", "Sort by islands outside 0-1"),
+            ('overlaps', "Overlaps", "Sort by overlapping faces"),
+        ],
+        default='overlaps'
+    )
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        if item.error:
+            row.label(text=item.name, icon='ERROR')
+            row.label(text=item.error)
+            return
+
+        has_issue = item.flipped or item.out_of_bounds or item.overlaps
+        row.label(text=item.name, icon='ERROR' if has_issue else 'CHECKMARK')
+        row.label(text=f"{item.texel_density:.0f} px/m")
+        sub = row.row(align=True)
+        sub.alert = bool(item.flipped)
+        sub.label(text=f"F {item.flipped}")
+        sub = row.row(align=True)
+        sub.alert = bool(item.out_of_bounds)
+        sub.label(text=f"OOB {item.out_of_bounds}")
+        sub = row.row(align=True)
+        sub.alert = bool(item.overlaps)
+        sub.label(text=f"OV {item.overlaps}")
+
+    def draw_filter(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, "filter_name", text="")
+        row.prop(self, "sort_key", text="")
+        row.prop(self, "use_filter_sort_reverse", text="", icon='SORT_DESC')
+
+    def filter_items(self, context, data, propname):
+        items = getattr(data, propname)
+        helper = bpy.types.UI_UL_list
+
+        flt_flags = []
+        if self.filter_name:
+            flt_flags = helper.filter_items_by_name(self.filter_name, self.bitflag_filter_item, items, "name")
+
+        if self.sort_key == 'NAME':
+            flt_neworder = helper.sort_items_by_name(items, "name")
+        else:
+            sort_data = [(index, getattr(item, self.sort_key)) for index, item in enumerate(items)]
+            flt_neworder = helper.sort_items_helper(sort_data, key=lambda entry: entry[1], reverse=True)
+
+        return flt_flags, flt_neworder
+
+class OBJECT_OT_CheckLPUVs(bpy.types.Operator):
+    bl_idname = "object.check_lp_uvs"
+    bl_label = "Check LP UVs"
+    bl_description = ("Check texel density, flipped faces, out of bounds islands and overlaps "
+                      "of the LP export collections (or selected objects if none are ticked)")
+
+    def execute(self, context):
+        from .uvcheck import check_uv_buffers, get_area_scale, read_uv_buffers
+
+        settings = context.scene.rename_settings
+        start = time.perf_counter()
+
+        objects = get_mesh_set_objects(settings.lowpoly_collections)
+        if not objects:
+            objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if not objects:
+            self.report({'WARNING'}, "No LP collections ticked and no mesh objects selected")
+            return {'CANCELLED'}
+
+        # Buffers are read here once per unique mesh, the numeric checks
+        # run in worker threads
+        groups = group_objects_by_mesh(objects)
+        jobs = []
+        mesh_errors = {}
+        for key, group in groups.items():
+            mesh = group[0].data
+            if not mesh.uv_layers.active:
+                mesh_errors[key] = "No UV map"
+            elif not mesh.polygons:
+                mesh_errors[key] = "No faces"
+            else:
+                jobs.append((key, read_uv_buffers(mesh)))
+
+        mesh_results = {}
+        workers = settings.uv_check_workers or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(check_uv_buffers, buffers, settings.uv_check_texture_size): key
+                       for key, buffers in jobs}
+            for future in as_completed(futures):
+                mesh_results[futures[future]] = future.result()
+
+        # Fan out to the objects, only texel density depends on the object scale
+        results = {}
+        errors = {}
+        for key, group in groups.items():
+            for obj in group:
+                if key in mesh_errors:
+                    errors[obj.name] = mesh_errors[key]
+                    continue
+                result = dict(mesh_results[key])
+                area_scale = get_area_scale(obj)
+                result["texel_density"] = result["texel_density"] / math.sqrt(area_scale) if area_scale > 0 else 0.0
+                results[obj.name] = result
+
+        settings.uv_check_results.clear()
+        for name in sorted(set(results) | set(errors)):
+            item = settings.uv_check_results.add()
+            item.name = name
+            if name in errors:
+                item.error = errors[name]
+                continue
+            for key, value in results[name].items():
+                setattr(item, key, value)
+        settings.uv_check_active_index = 0
+
+        issues = sum(1 for result in results.values()
+                     if result["flipped"] or result["out_of_bounds"] or result["overlaps"])
+        self.report({'INFO'}, f"Checked {len(results)} object(s) in {time.perf_counter() - start:.2f}s "
+                              f"({format_instance_savings(len(groups), len(objects))}): "
+                              f"{issues} with UV issues, {len(errors)} skipped")
+        return {'FINISHED'}
+
+class OBJECT_OT_SelectUVCheckResult(bpy.types.Operator):
+    bl_idname = "object.select_uv_check_result"
+    bl_label = "Select Object"
+    bl_description = "Select the object of the active UV check result"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        settings = context.scene.rename_settings
+        index = settings.uv_check_active_index
+
+        if not 0 <= index < len(settings.uv_check_results):
+            self.report({'WARNING'}, "No result selected")
+            return {'CANCELLED'}
+
+        obj = bpy.data.objects.get(settings.uv_check_results[index].name)
+        if not obj or obj.name not in context.view_layer.objects:
+            self.report({'WARNING'}, "Object is not in the view layer")
+            return {'CANCELLED'}
+
+        select_only(context, [obj])
+        context.view_layer.objects.active = obj
+        return {'FINISHED'}
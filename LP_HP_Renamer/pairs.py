@@ -0,0 +1,68 @@
+import bpy
+
+def get_pair_name(obj_name, lp_suffix, hp_suffix):
+    if obj_name.endswith(lp_suffix):
+        return obj_name[:-len(lp_suffix)] + hp_suffix
+    elif obj_name.endswith(hp_suffix):
+        return obj_name[:-len(hp_suffix)] + lp_suffix
+    else:
+        return None
+
+def link_pair(lp_obj, hp_obj):
+    # Drop links of previous partners pointing at either object
+    for obj in (lp_obj, hp_obj):
+        old = obj.lphp_pair
+        if old and old not in (lp_obj, hp_obj) and old.lphp_pair == obj:
+            old.lphp_pair = None
+            old.lphp_side = 'NONE'
+
+    lp_obj.lphp_pair = hp_obj
+    lp_obj.lphp_side = 'LP'
+    hp_obj.lphp_pair = lp_obj
+    hp_obj.lphp_side = 'HP'
+
+def is_in_scene(obj):
+    # A deleted object stays in bpy.data as long as something points at it,
+    # the lphp_pair pointer of its old partner is enough
+    return bool(obj.users_scene)
+
+def get_linked_pair(obj):
+    # Only reciprocal links count, a duplicated object still points at
+    # its source's partner but isn't pointed back at
+    other = obj.lphp_pair
+    if (other and other.lphp_pair == obj and {obj.lphp_side, other.lphp_side} == {'LP', 'HP'}
+            and is_in_scene(other)):
+        return other
+    return None
+
+def find_counterpart(obj, lp_suffix, hp_suffix):
+    # Stored link first, name lookup (a dict lookup, no scene scan) second
+    other = get_linked_pair(obj)
+    if other:
+        return other
+    pair_name = get_pair_name(obj.name, lp_suffix, hp_suffix)
+    other = bpy.data.objects.get(pair_name) if pair_name else None
+    return other if other and is_in_scene(other) else None
+
+def get_pair_side(obj, lp_suffix, hp_suffix):
+    if get_linked_pair(obj):
+        return obj.lphp_side
+    if obj.name.endswith(lp_suffix):
+        return 'LP'
+    if obj.name.endswith(hp_suffix):
+        return 'HP'
+    return 'NONE'
+
+def collect_lp_hp_pairs(objects, lp_suffix, hp_suffix):
+    # Returns (base name, LP, HP) for every LP mesh with an HP counterpart,
+    # sorted by base name. Base names come from the LP name when it has
+    # the suffix, otherwise the LP name is used as is.
+    pairs = {}
+    for obj in objects:
+        if obj.type != 'MESH' or get_pair_side(obj, lp_suffix, hp_suffix) != 'LP':
+            continue
+        hp_obj = find_counterpart(obj, lp_suffix, hp_suffix)
+        if hp_obj and hp_obj.type == 'MESH':
+            base = obj.name[:-len(lp_suffix)] if obj.name.endswith(lp_suffix) else obj.name
+            pairs[base] = (base, obj, hp_obj)
+    return [pairs[base] for base in sorted(pairs)]
@@ -0,0 +1,195 @@
+import bpy
+
+from .meshstats import clear_collection_stats, rebuild_collection_stats, update_set_stats_timer
+
+def on_export_item_toggled(self, context):
+    # Set totals are recomputed once from a timer, so ticking many
+    # collections at once (e.g. loading a preset) only costs one pass
+    if not bpy.app.timers.is_registered(update_set_stats_timer):
+        bpy.app.timers.register(update_set_stats_timer, first_interval=0.0)
+
+def on_show_stats_toggled(self, context):
+    if self.show_collection_stats:
+        rebuild_collection_stats(self)
+    else:
+        clear_collection_stats()
+
+class ExportCollectionItem(bpy.types.PropertyGroup):
+    name: bpy.props.StringProperty(name="Collection Name")
+    enabled: bpy.props.BoolProperty(name="Enable", default=True, update=on_export_item_toggled)
+
+class ExportPreset(bpy.types.PropertyGroup):
+    name: bpy.props.StringProperty(name="Preset Name", default="Preset")
+    enabled: bpy.props.BoolProperty(
+        name="Enable", default=True,
+        description="Include this preset in Export All Presets"
+    )
+    subfolder: bpy.props.StringProperty(
+        name="Subfolder", default="",
+        description="Folder inside the export directory for this preset's files"
+    )
+
+    highpoly_collections: bpy.props.CollectionProperty(type=ExportCollectionItem)
+    lowpoly_collections: bpy.props.CollectionProperty(type=ExportCollectionItem)
+
+    highpoly_filename: bpy.props.StringProperty(name="HP Filename", default="MeshName_high.fbx")
+    lowpoly_filename: bpy.props.StringProperty(name="LP Filename", default="MeshName_low.fbx")
+
+    export_hp: bpy.props.BoolProperty(name="Export HP", default=True)
+    export_lp: bpy.props.BoolProperty(name="Export LP", default=True)
+    export_hp_mesh_only: bpy.props.BoolProperty(name="Only Mesh (HP)", default=True)
+    export_hp_exclude_animation: bpy.props.BoolProperty(name="Exclude Animation (HP)", default=True)
+    export_lp_mesh_only: bpy.props.BoolProperty(name="Only Mesh (LP)", default=True)
+    export_lp_exclude_animation: bpy.props.BoolProperty(name="Exclude Animation (LP)", default=True)
+
+class UVCheckResult(bpy.types.PropertyGroup):
+    name: bpy.props.StringProperty(name="Object")
+    faces: bpy.props.IntProperty(name="Faces")
+    islands: bpy.props.IntProperty(name="Islands")
+    texel_density: bpy.props.FloatProperty(name="Texel Density", description="Pixels per meter")
+    flipped: bpy.props.IntProperty(name="Flipped", description="Faces with flipped UV winding")
+    out_of_bounds: bpy.props.IntProperty(name="Out of Bounds", description="UV islands leaving the 0-1 range")
+    overlaps: bpy.props.IntProperty(name="Overlaps", description="Faces overlapping other UV faces")
+    error: bpy.props.StringProperty(name="Error")
+
+class RenameSettings(bpy.types.PropertyGroup):
+    base_name: bpy.props.StringProperty(name="Object Name", default="MyObject")
+    lp_suffix: bpy.props.StringProperty(name="LP Suffix", default="_low")
+    hp_suffix: bpy.props.StringProperty(name="HP Suffix", default="_high")
+    find_text: bpy.props.StringProperty(name="Find", default="")
+    replace_text: bpy.props.StringProperty(name="Replace", default="")
+    export_path: bpy.props.StringProperty(name="Directory", subtype='DIR_PATH')
+
+    export_manifest: bpy.props.BoolProperty(
+        name="Write Manifest", default=True,
+        description="Write a .manifest.jsonl next to every exported FBX listing objects, pairs, "
+                    "transforms, bounds, tri counts, modifiers and mesh hashes"
+    )
+
+    show_collection_stats: bpy.props.BoolProperty(
+        name="Show Stats", default=False, update=on_show_stats_toggled,
+        description="Track tri/vert/object counts of the HP/LP export collections"
+    )
+
+    export_collections: bpy.props.CollectionProperty(type=ExportCollectionItem)  # (optional legacy/general)
+    highpoly_collections: bpy.props.CollectionProperty(type=ExportCollectionItem)
+    lowpoly_collections: bpy.props.CollectionProperty(type=ExportCollectionItem)
+
+    # New properties for export filenames
+    highpoly_filename: bpy.props.StringProperty(name="Filename", default="MeshName_high.fbx")
+    lowpoly_filename: bpy.props.StringProperty(name="Filename", default="MeshName_low.fbx")
+    
+    export_hp_mesh_only: bpy.props.BoolProperty(
+        name="Only Mesh (HP)", default=True,
+        description="Export only mesh for High Poly"
+    )
+    export_hp_exclude_animation: bpy.props.BoolProperty(
+        name="Exclude Animation (HP)", default=True,
+        description="Exclude exporting for High Poly"
+    )
+    export_lp_mesh_only: bpy.props.BoolProperty(
+        name="Only Mesh (LP)", default=True,
+        description="Export only mesh for Low Poly"
+    )
+    export_lp_exclude_animation: bpy.props.BoolProperty(
+        name="Exclude Animation (LP)", default=True,
+        description="Exclude exporting animation for Low Poly"
+    )
+
+    export_hp_chunked: bpy.props.BoolProperty(
+        name="Chunked Export (HP)", default=False,
+        description="Split the High Poly set into numbered files under a triangle budget to bound memory use"
+    )
+    export_hp_chunk_tris: bpy.props.IntProperty(
+        name="Tris per Chunk", default=2000000, min=1000, soft_max=20000000,
+        description="Estimated triangle budget per High Poly chunk (subdivision levels included)"
+    )
+
+    # Baker
+    bake_normal: bpy.props.BoolProperty(name="Normal", default=True)
+    bake_ao: bpy.props.BoolProperty(name="AO", default=True)
+    bake_id: bpy.props.BoolProperty(
+        name="ID", default=False,
+        description="Bake the High Poly material colors as an ID map"
+    )
+    bake_resolution: bpy.props.IntProperty(name="Resolution", default=2048, min=64, max=16384)
+    bake_samples: bpy.props.IntProperty(
+        name="Samples", default=16, min=1, soft_max=512,
+        description="Cycles samples used for AO and ID bakes"
+    )
+    bake_margin: bpy.props.IntProperty(name="Margin", default=16, min=0, max=64, subtype='PIXEL')
+    bake_cage_extrusion: bpy.props.FloatProperty(
+        name="Extrusion", default=0.05, min=0.0, soft_max=1.0, subtype='DISTANCE'
+    )
+    bake_max_ray_distance: bpy.props.FloatProperty(
+        name="Max Ray Distance", default=0.0, min=0.0, soft_max=1.0, subtype='DISTANCE'
+    )
+    bake_workers: bpy.props.IntProperty(
+        name="Workers", default=1, min=1, soft_max=16,
+        description="Background Blender processes to split the pairs across, 1 bakes in this session"
+    )
+    bake_worker_timeout: bpy.props.IntProperty(
+        name="Worker Timeout (min)", default=60, min=1, soft_max=600,
+        description="Workers still running after this many minutes are stopped and their pairs reported as failed"
+    )
+    bake_subfolder: bpy.props.StringProperty(
+        name="Subfolder", default="bake",
+        description="Folder inside the export directory for baked maps and the bake report"
+    )
+
+    # LP UV checker
+    uv_check_texture_size: bpy.props.IntProperty(
+        name="Texture Size", default=2048, min=1, max=16384,
+        description="Texture resolution used for texel density"
+    )
+    uv_check_workers: bpy.props.IntProperty(
+        name="Workers", default=0, min=0, soft_max=32,
+        description="Parallel checker threads, 0 uses the CPU count"
+    )
+    uv_check_results: bpy.props.CollectionProperty(type=UVCheckResult)
+    uv_check_active_index: bpy.props.IntProperty(default=0)
+
+    # Library audit
+    audit_library_path: bpy.props.StringProperty(
+        name="Library", subtype='DIR_PATH',
+        description="Folder of asset .blend files to check for unpaired LP/HP objects"
+    )
+    audit_report_path: bpy.props.StringProperty(
+        name="Report", subtype='FILE_PATH', default="//lphp_library_audit.csv",
+        description="Report file, .csv or .json (a .cache.json is kept next to it)"
+    )
+    audit_recursive: bpy.props.BoolProperty(name="Include Subfolders", default=True)
+    audit_workers: bpy.props.IntProperty(
+        name="Workers", default=0, min=0, soft_max=32,
+        description="Parallel file readers, 0 uses the CPU count"
+    )
+
+    # Selection query
+    query_text: bpy.props.StringProperty(
+        name="Query", default="side:HP pair.!has:WEIGHTED_NORMAL",
+        description=("Space separated terms, all must match: name:<regex> side:LP|HP|NONE type:MESH "
+                     "collection:<name> polys:<min..max> tris:<min..max> has:<MODIFIER_TYPE> paired:yes|no. "
+                     "Prefix ! to negate, pair. to test the LP/HP counterpart, quote values with spaces")
+    )
+    query_extend: bpy.props.BoolProperty(
+        name="Extend", default=False,
+        description="Add the matches to the current selection instead of replacing it"
+    )
+
+    # Named export presets (one per asset)
+    export_presets: bpy.props.CollectionProperty(type=ExportPreset)
+    active_preset_index: bpy.props.IntProperty(name="Active Preset", default=0)
+
+    # Auto export on save
+    auto_export_on_save: bpy.props.BoolProperty(
+        name="Auto Export on Save", default=False,
+        description="After saving, re-export only the HP/LP sets whose objects changed since their last export"
+    )
+    auto_export_presets: bpy.props.BoolProperty(
+        name="Include Presets", default=True,
+        description="Also re-export changed sets of enabled export presets"
+    )
+    auto_export_delay: bpy.props.FloatProperty(
+        name="Delay", default=2.0, min=0.0, soft_max=30.0, subtype='TIME', unit='TIME',
+        description="Seconds to wait after the last save before exporting, repeated saves restart the wait"
+    )
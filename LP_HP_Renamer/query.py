@@ -0,0 +1,113 @@
+import time
+
+import bpy
+
+from .meshstats import get_mesh_counts
+from .pairs import find_counterpart, get_pair_side
+from .query_parser import parse_query
+
+def make_query_index(lp_suffix, hp_suffix):
+    # Indexes are filled on first use and shared by all terms of one query
+    return {
+        "lp_suffix": lp_suffix,
+        "hp_suffix": hp_suffix,
+        "sides": {},        # object name_full -> 'LP'/'HP'/'NONE'
+        "pairs": {},        # object name_full -> counterpart or None
+        "collections": {},  # collection name -> object name_full set
+        "modifiers": None,  # modifier type -> object name_full set
+    }
+
+def get_indexed_side(index, obj):
+    key = obj.name_full
+    side = index["sides"].get(key)
+    if side is None:
+        side = index["sides"][key] = get_pair_side(obj, index["lp_suffix"], index["hp_suffix"])
+    return side
+
+def get_indexed_pair(index, obj):
+    key = obj.name_full
+    if key not in index["pairs"]:
+        index["pairs"][key] = find_counterpart(obj, index["lp_suffix"], index["hp_suffix"])
+    return index["pairs"][key]
+
+def get_collection_members(index, name):
+    members = index["collections"].get(name)
+    if members is None:
+        col = bpy.data.collections.get(name)
+        if col is None:
+            raise ValueError(f"Collection '{name}' not found")
+        members = index["collections"][name] = {obj.name_full for obj in col.all_objects}
+    return members
+
+def get_modifier_index(index):
+    # One pass over every object's modifier stack, whatever the number of has: terms
+    if index["modifiers"] is None:
+        modifiers = {}
+        for obj in bpy.data.objects:
+            for mod in obj.modifiers:
+                modifiers.setdefault(mod.type, set()).add(obj.name_full)
+        index["modifiers"] = modifiers
+    return index["modifiers"]
+
+def in_range(count, bounds):
+    low, high = bounds
+    return (low is None or count >= low) and (high is None or count <= high)
+
+def match_term(index, key, value, objects):
+    # Returns the name_full set of the objects (a name_full -> object dict)
+    # passing the test
+    if key == "name":
+        return {name for name, obj in objects.items() if value.search(obj.name)}
+    if key == "side":
+        return {name for name, obj in objects.items() if get_indexed_side(index, obj) == value}
+    if key == "type":
+        return {name for name, obj in objects.items() if obj.type == value}
+    if key == "paired":
+        return {name for name, obj in objects.items() if (get_indexed_pair(index, obj) is not None) == value}
+    if key == "collection":
+        return objects.keys() & get_collection_members(index, value)
+    if key == "has":
+        return objects.keys() & get_modifier_index(index).get(value, set())
+
+    # polys/tris: counts are cached per mesh, linked duplicates share them
+    column = 1 if key == "polys" else 2
+    return {name for name, obj in objects.items()
+            if obj.type == 'MESH' and in_range(get_mesh_counts(obj.data)[column], value)}
+
+def evaluate_query(terms, objects, index):
+    candidates = {obj.name_full: obj for obj in objects}
+
+    for term in terms:
+        if not candidates:
+            break
+
+        if term["pair"]:
+            counterparts = {}
+            for name, obj in candidates.items():
+                other = get_indexed_pair(index, obj)
+                if other is not None:
+                    counterparts[name] = other
+            tested = {other.name_full: other for other in counterparts.values()}
+            passed = match_term(index, term["key"], term["value"], tested)
+            if term["pair_negate"]:
+                passed = tested.keys() - passed
+            matched = {name for name, other in counterparts.items() if other.name_full in passed}
+        else:
+            matched = match_term(index, term["key"], term["value"], candidates)
+
+        if term["negate"]:
+            candidates = {name: obj for name, obj in candidates.items() if name not in matched}
+        else:
+            candidates = {name: candidates[name] for name in matched}
+
+    return sorted(candidates.values(), key=lambda obj: obj.name_full)
+
+def run_query(query, objects, lp_suffix, hp_suffix):
+    # Returns the matching objects sorted by name and the time spent in
+    # parsing and evaluation (index building happens during evaluation)
+    start = time.perf_counter()
+    terms = parse_query(query)
+    parsed = time.perf_counter()
+    matches = evaluate_query(terms, objects, make_query_index(lp_suffix, hp_suffix))
+    done = time.perf_counter()
+    return matches, {"parse": parsed - start, "evaluate": done - parsed}
@@ -0,0 +1,67 @@
+# Parses selection queries into terms. Imports no bpy so it can be
+# tested outside Blender, evaluation lives in query.py.
+
+import re
+import shlex
+
+# A term is [!]key:value or [!]pair.[!]key:value, terms are ANDed.
+# The leading ! negates the whole term, the one after pair. only the test
+# on the counterpart (objects without a counterpart never match pair. terms).
+QUERY_TERM = re.compile(r'^(?P<negate>!?)(?P<pair>pair\.)?(?P<pair_negate>!?)(?P<key>[a-z]+):(?P<value>.+)$')
+
+# Cheap tests run first so the expensive ones see fewer candidates
+QUERY_KEYS = ["side", "type", "name", "paired", "collection", "polys", "tris", "has"]
+
+def parse_range(value):
+    # "100..5000", "..5000", "100..", or a single exact number
+    low, sep, high = value.partition("..")
+    try:
+        if not sep:
+            return int(low), int(low)
+        return (int(low) if low else None), (int(high) if high else None)
+    except ValueError:
+        raise ValueError(f"Invalid range '{value}', use min..max") from None
+
+def parse_query(query):
+    lexer = shlex.shlex(query, posix=True)
+    lexer.whitespace_split = True
+    lexer.escape = ""      # keep regex backslashes
+    lexer.commenters = ""  # and # characters, name:^SM_#1 is a pattern
+    try:
+        tokens = list(lexer)
+    except ValueError as e:
+        raise ValueError(f"Invalid query: {e}") from None
+
+    terms = []
+    for token in tokens:
+        match = QUERY_TERM.match(token)
+        if not match or match["key"] not in QUERY_KEYS:
+            raise ValueError(f"Unknown term '{token}', keys are: {', '.join(QUERY_KEYS)}")
+
+        key, value = match["key"], match["value"]
+        if key == "name":
+            try:
+                value = re.compile(value)
+            except re.error as e:
+                raise ValueError(f"Invalid name pattern '{value}': {e}") from None
+        elif key in {"polys", "tris"}:
+            value = parse_range(value)
+        elif key in {"side", "type", "has"}:
+            value = value.upper()
+        elif key == "paired":
+            if value.lower() not in {"yes", "no"}:
+                raise ValueError(f"paired takes yes or no, not '{value}'")
+            value = value.lower() == "yes"
+
+        terms.append({
+            "key": key,
+            "value": value,
+            "negate": bool(match["negate"]),
+            "pair": bool(match["pair"]),
+            "pair_negate": bool(match["pair_negate"]),
+        })
+
+    if not terms:
+        raise ValueError("Empty query")
+    terms.sort(key=lambda term: (term["pair"], QUERY_KEYS.index(term["key"])))
+    return terms
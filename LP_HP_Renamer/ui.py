@@ -0,0 +1,265 @@
+import bpy
+
+from .meshstats import format_stats, get_collection_stats, get_set_stats
+
+class VIEW3D_PT_RenamePanel(bpy.types.Panel):
+    bl_label = "LP/HP Renamer"
+    bl_idname = "VIEW3D_PT_a_rename_lphp"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Ed's Tools"
+
+    def draw(self, context):
+        layout = self.layout
+        settings = bpy.context.scene.rename_settings
+
+        box1 = layout.box()
+        box1.label(text="LP/HP Rename", icon="MODIFIER")
+        box1.prop(settings, "base_name")
+        box1.prop(settings, "lp_suffix")
+        box1.prop(settings, "hp_suffix")
+        box1.operator("object.rename_lphp", icon="FONT_DATA")
+        box1.operator("object.swap_lphp", icon="FILE_REFRESH")
+        box1.operator("object.swap_lphp_names", icon="FILE_REFRESH")
+        box1.operator("object.swap_lphp_collections", icon="FILE_REFRESH")
+        box1.operator("object.verify_lp_pairs", icon="CHECKMARK")
+        row = box1.row(align=True)
+        row.operator("object.rebuild_pair_links", icon="LINKED")
+        row.operator("object.check_pair_links", icon="CHECKMARK")
+
+        box2 = layout.box()
+        box2.label(text="Wireframe Tools")
+        box2.operator("object.toggle_wire_overlay", text="Toggle Wire Overlay on Selected")
+
+        box3 = layout.box()
+        box3.label(text="Find & Replace", icon="VIEWZOOM")
+        box3.prop(settings, "find_text")
+        box3.prop(settings, "replace_text")
+        box3.operator("object.find_replace_names", icon="VIEWZOOM")
+
+        layout.separator()
+
+class VIEW3D_PT_ExportPanel(bpy.types.Panel):
+    bl_label = "LP/HP Collections Exporter"
+    bl_idname = "VIEW3D_PT_b_lphp_exporter"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Ed's Tools"
+
+    def draw(self, context):
+        layout = self.layout
+        settings = bpy.context.scene.rename_settings
+
+        box1 = layout.box()
+        box1.label(text="LP/HP Export Collections", icon='EXPORT')
+        # Export path field
+        box1.prop(settings, "export_path")
+        box1.prop(settings, "export_manifest")
+        box1.operator("object.refresh_export_collections", icon='FILE_REFRESH')  # Refresh button
+
+        # Stats are only read from the cache here
+        show_stats = settings.show_collection_stats
+        row = box1.row()
+        row.prop(settings, "show_collection_stats", icon='INFO')
+        if show_stats:
+            row.operator("object.refresh_collection_stats", text="", icon='FILE_REFRESH')
+
+            hp_stats = get_set_stats('HP')
+            lp_stats = get_set_stats('LP')
+            box_stats = box1.box()
+            box_stats.label(text=f"HP: {format_stats(hp_stats)}")
+            box_stats.label(text=f"LP: {format_stats(lp_stats)}")
+            if hp_stats and lp_stats and lp_stats["tris"]:
+                box_stats.label(text=f"LP:HP tris 1:{hp_stats['tris'] / lp_stats['tris']:.1f}")
+
+        # High Poly section
+        box_hp = box1.box()
+        box_hp.label(text="High Poly Collections:", icon='EVENT_UP_ARROW')
+        for item in settings.highpoly_collections:
+            if show_stats:
+                row = box_hp.row()
+                row.prop(item, "enabled", text=item.name)
+                row.label(text=format_stats(get_collection_stats(item.name)))
+            else:
+                box_hp.prop(item, "enabled", text=item.name)
+        
+        # Input for high poly export filename
+        box_hp_settings = box_hp.box()
+        box_hp_settings.prop(settings, "highpoly_filename")
+        box_hp_settings.label(text="High Poly Export Settings")
+        box_hp_settings.prop(settings, "export_hp_mesh_only")
+        box_hp_settings.prop(settings, "export_hp_exclude_animation")
+        box_hp_settings.prop(settings, "export_hp_chunked")
+        if settings.export_hp_chunked:
+            box_hp_settings.prop(settings, "export_hp_chunk_tris")
+        box_hp.operator("export_collections.export_mesh_set", text="Export High Poly").type = 'HP'
+
+        # Low Poly section
+        box_lp = box1.box()
+        box_lp.label(text="Low Poly Collections:", icon='EVENT_DOWN_ARROW')
+        for item in settings.lowpoly_collections:
+            if show_stats:
+                row = box_lp.row()
+                row.prop(item, "enabled", text=item.name)
+                row.label(text=format_stats(get_collection_stats(item.name)))
+            else:
+                box_lp.prop(item, "enabled", text=item.name)
+
+        # Input for low poly export filename
+        box_lp_settings = box_lp.box()
+        box_lp_settings.prop(settings, "lowpoly_filename")
+        box_lp_settings.label(text="Low Poly Export Settings")
+        box_lp_settings.prop(settings, "export_lp_mesh_only")
+        box_lp_settings.prop(settings, "export_lp_exclude_animation")
+        box_lp.operator("export_collections.export_mesh_set", text="Export Low Poly").type = 'LP'
+
+        # Presets section
+        box_presets = layout.box()
+        box_presets.label(text="Export Presets", icon='PRESET')
+        row = box_presets.row()
+        row.template_list("EXPORT_UL_Presets", "", settings, "export_presets", settings, "active_preset_index", rows=3)
+        col = row.column(align=True)
+        col.operator("export_collections.add_preset", text="", icon='ADD')
+        col.operator("export_collections.remove_preset", text="", icon='REMOVE')
+
+        if 0 <= settings.active_preset_index < len(settings.export_presets):
+            preset = settings.export_presets[settings.active_preset_index]
+            row = box_presets.row(align=True)
+            row.operator("export_collections.load_preset", icon='IMPORT')
+            row.operator("export_collections.store_preset", icon='FILE_TICK')
+
+            box_preset = box_presets.box()
+            box_preset.prop(preset, "subfolder")
+            row = box_preset.row()
+            row.prop(preset, "export_hp")
+            row.prop(preset, "export_lp")
+            box_preset.prop(preset, "highpoly_filename")
+            for item in preset.highpoly_collections:
+                if item.enabled:
+                    box_preset.label(text=item.name, icon='EVENT_UP_ARROW')
+            box_preset.prop(preset, "lowpoly_filename")
+            for item in preset.lowpoly_collections:
+                if item.enabled:
+                    box_preset.label(text=item.name, icon='EVENT_DOWN_ARROW')
+
+        box_presets.operator("export_collections.export_all_presets", icon='EXPORT')
+
+        # Auto export section
+        box_auto = layout.box()
+        box_auto.prop(settings, "auto_export_on_save", icon='FILE_TICK')
+        row = box_auto.row()
+        row.enabled = settings.auto_export_on_save
+        row.prop(settings, "auto_export_delay")
+        row.prop(settings, "auto_export_presets")
+
+class VIEW3D_PT_BakePanel(bpy.types.Panel):
+    bl_label = "LP/HP Baker"
+    bl_idname = "VIEW3D_PT_c_lphp_baker"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Ed's Tools"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        settings = bpy.context.scene.rename_settings
+
+        box1 = layout.box()
+        box1.label(text="Bake Maps (Cycles CPU)", icon='RENDER_STILL')
+        row = box1.row(align=True)
+        row.prop(settings, "bake_normal", toggle=True)
+        row.prop(settings, "bake_ao", toggle=True)
+        row.prop(settings, "bake_id", toggle=True)
+        box1.prop(settings, "bake_resolution")
+        box1.prop(settings, "bake_samples")
+        box1.prop(settings, "bake_margin")
+        box1.prop(settings, "bake_cage_extrusion")
+        box1.prop(settings, "bake_max_ray_distance")
+        box1.prop(settings, "bake_workers")
+        if settings.bake_workers > 1:
+            box1.prop(settings, "bake_worker_timeout")
+        box1.prop(settings, "bake_subfolder")
+        box1.operator("object.bake_lphp_pairs", icon='RENDER_STILL')
+
+class VIEW3D_PT_LibraryAuditPanel(bpy.types.Panel):
+    bl_label = "LP/HP Library Audit"
+    bl_idname = "VIEW3D_PT_d_lphp_library_audit"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Ed's Tools"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        settings = bpy.context.scene.rename_settings
+
+        box1 = layout.box()
+        box1.label(text="Missing Pairs in Library", icon='ASSET_MANAGER')
+        box1.prop(settings, "audit_library_path")
+        box1.prop(settings, "audit_report_path")
+        box1.prop(settings, "audit_recursive")
+        box1.prop(settings, "audit_workers")
+        box1.operator("object.audit_library_pairs", icon='VIEWZOOM')
+
+class VIEW3D_PT_UVCheckPanel(bpy.types.Panel):
+    bl_label = "LP UV Checker"
+    bl_idname = "VIEW3D_PT_e_lp_uv_checker"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Ed's Tools"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        settings = bpy.context.scene.rename_settings
+
+        box1 = layout.box()
+        box1.label(text="LP UV Quality", icon='UV')
+        box1.prop(settings, "uv_check_texture_size")
+        box1.prop(settings, "uv_check_workers")
+        box1.operator("object.check_lp_uvs", icon='VIEWZOOM')
+        box1.template_list("LPHP_UL_UVCheckResults", "", settings, "uv_check_results",
+                           settings, "uv_check_active_index", rows=5)
+        box1.operator("object.select_uv_check_result", icon='RESTRICT_SELECT_OFF')
+
+class VIEW3D_PT_QueryPanel(bpy.types.Panel):
+    bl_label = "LP/HP Selection Query"
+    bl_idname = "VIEW3D_PT_f_lphp_query"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Ed's Tools"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        settings = bpy.context.scene.rename_settings
+
+        box1 = layout.box()
+        box1.label(text="Select by Query", icon='VIEWZOOM')
+        box1.prop(settings, "query_text", text="")
+        row = box1.row(align=True)
+        row.prop(settings, "query_extend")
+        row.operator("object.select_by_query", icon='RESTRICT_SELECT_OFF')
+
+        col = box1.column(align=True)
+        col.scale_y = 0.8
+        col.label(text="name:<regex>  side:LP|HP  collection:<name>")
+        col.label(text="polys:10..500  has:SUBSURF  paired:no")
+        col.label(text="! negates, pair. tests the counterpart")
+
+class VIEW3D_PT_WeightedNormalizerPanel(bpy.types.Panel):
+    bl_label = "LP Weighted Normalizer"
+    bl_idname = "VIEW3D_PT_weighted_normalizer_panel"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Ed's Tools"
+
+    def draw(self, context):
+        layout = self.layout
+        settings = bpy.context.scene.rename_settings
+
+        box1 = layout.box()
+        box1.label(text="Weighted Normalizer", icon='MOD_VERTEX_WEIGHT')
+        box1.operator("object.add_weighted_normal", text="Add Weighted Normal", icon='EVENT_NDOF_BUTTON_PLUS')
+        box1.operator("object.del_weighted_normal", text="Delete Weighted Normal", icon='EVENT_NDOF_BUTTON_MINUS')
+        box1.operator("object.verify_weighted_normal", text="Verify Weighted Normal", icon='CHECKMARK')
@@ -0,0 +1,50 @@
+import bpy
+
+def get_all_objects_from_collection(collection):
+    objects = list(collection.objects)
+    for child in collection.children:
+        objects.extend(get_all_objects_from_collection(child))
+    return objects
+
+def select_only(context, objects):
+    for obj in context.selected_objects:
+        obj.select_set(False)
+    for obj in objects:
+        obj.select_set(True)
+
+def get_mesh_set_objects(collection_items, membership=None):
+    # membership maps collection name -> mesh objects and can be shared
+    # between calls so each collection is only walked once per run
+    export_objects = []
+    seen = set()
+
+    for item in collection_items:
+        if not item.enabled:
+            continue
+
+        if membership is not None and item.name in membership:
+            meshes = membership[item.name]
+        else:
+            col = bpy.data.collections.get(item.name)
+            meshes = [obj for obj in col.all_objects if obj.type == 'MESH'] if col else []
+            if membership is not None:
+                membership[item.name] = meshes
+
+        for obj in meshes:
+            if obj.name_full not in seen:
+                seen.add(obj.name_full)
+                export_objects.append(obj)
+
+    return export_objects
+
+def group_objects_by_mesh(objects):
+    # Linked duplicates share one mesh datablock, so geometry work keyed
+    # on the mesh name_full runs once per group and fans out to the objects
+    groups = {}
+    for obj in objects:
+        if obj.type == 'MESH' and obj.data:
+            groups.setdefault(obj.data.name_full, []).append(obj)
+    return groups
+
+def format_instance_savings(mesh_count, object_count):
+    return f"{mesh_count} unique mesh(es) for {object_count} object(s)"
@@ -0,0 +1,178 @@
+import numpy as np
+
+# UVs this close to the 0-1 border or to each other count as touching
+UV_EPSILON = 1e-6
+
+def read_uv_buffers(mesh):
+    # Main thread only: bulk copies of everything the checks need, so the
+    # checks themselves can run in worker threads without touching bpy.
+    # Read once per mesh, linked duplicates share the result.
+    loop_count = len(mesh.loops)
+    poly_count = len(mesh.polygons)
+
+    uv = np.empty(loop_count * 2, dtype=np.float32)
+    mesh.uv_layers.active.data.foreach_get("uv", uv)
+    loop_verts = np.empty(loop_count, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    loop_start = np.empty(poly_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+    loop_total = np.empty(poly_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_total)
+    area = np.empty(poly_count, dtype=np.float32)
+    mesh.polygons.foreach_get("area", area)
+
+    return {
+        "uv": uv.reshape(-1, 2).astype(np.float64),
+        "loop_verts": loop_verts,
+        "loop_start": loop_start,
+        "loop_total": loop_total,
+        "area": float(area.sum()),
+    }
+
+def get_area_scale(obj):
+    # Factor from the mesh's local face areas to world space
+    sx, sy, sz = obj.matrix_world.to_scale()
+    return abs(sx * sy * sz) ** (2.0 / 3.0)
+
+def find_uv_islands(uv, loop_verts, face_of_loop, poly_count):
+    # Faces sharing a UV vertex (same mesh vertex, same UV) belong to the
+    # same island. Min-label propagation with pointer jumping.
+    quantized = np.round(uv / UV_EPSILON).astype(np.int64)
+    keys = np.stack([loop_verts.astype(np.int64), quantized[:, 0], quantized[:, 1]], axis=1)
+    _unique, loop_uv_vert = np.unique(keys, axis=0, return_inverse=True)
+    loop_uv_vert = loop_uv_vert.reshape(-1)
+
+    labels = np.arange(loop_uv_vert.max() + 1 if len(loop_uv_vert) else 0)
+    while True:
+        face_label = np.full(poly_count, len(labels), dtype=labels.dtype)
+        np.minimum.at(face_label, face_of_loop, labels[loop_uv_vert])
+        new_labels = labels.copy()
+        np.minimum.at(new_labels, loop_uv_vert, face_label[face_of_loop])
+        while True:
+            jumped = new_labels[new_labels]
+            if np.array_equal(jumped, new_labels):
+                break
+            new_labels = jumped
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+
+    _unique, island_of_face = np.unique(face_label, return_inverse=True)
+    return island_of_face.reshape(-1), len(_unique)
+
+def find_uv_overlaps(tri_uvs, face_of_tri):
+    # Triangles are binned into a uniform grid over the UV bounds, only
+    # triangles sharing a cell are tested against each other (2D SAT)
+    tri_count = len(tri_uvs)
+    if tri_count < 2:
+        return 0
+
+    lo = tri_uvs.min(axis=1)
+    hi = tri_uvs.max(axis=1)
+    origin = lo.min(axis=0)
+    extent = np.maximum(hi.max(axis=0) - origin, UV_EPSILON)
+    # Cells about the size of an average triangle keep both the entries
+    # per triangle and the triangles per cell low
+    cell_size = np.maximum((hi - lo).mean(axis=0) * 2, extent / 1024)
+    grid = int(np.ceil((extent / cell_size).max()))
+
+    cell_lo = np.clip(((lo - origin) / cell_size).astype(np.int64), 0, grid - 1)
+    cell_hi = np.clip(((hi - origin) / cell_size).astype(np.int64), 0, grid - 1)
+    width = cell_hi[:, 0] - cell_lo[:, 0] + 1
+    cells_per_tri = width * (cell_hi[:, 1] - cell_lo[:, 1] + 1)
+
+    tri_of_entry = np.repeat(np.arange(tri_count), cells_per_tri)
+    local = np.arange(len(tri_of_entry)) - np.repeat(np.cumsum(cells_per_tri) - cells_per_tri, cells_per_tri)
+    cell_x = cell_lo[tri_of_entry, 0] + local % width[tri_of_entry]
+    cell_y = cell_lo[tri_of_entry, 1] + local // width[tri_of_entry]
+    cell_of_entry = cell_y * grid + cell_x
+
+    order = np.argsort(cell_of_entry, kind='stable')
+    cell_of_entry = cell_of_entry[order]
+    tri_of_entry = tri_of_entry[order]
+
+    # Candidate pairs: entries d apart in the sorted list that share a cell.
+    # A cheap bounding box rejection runs before the separating axis test,
+    # triangles that only touch (shared edges) are dropped here already.
+    pairs = []
+    offset = 1
+    while offset < len(cell_of_entry):
+        same_cell = cell_of_entry[offset:] == cell_of_entry[:-offset]
+        if not same_cell.any():
+            break
+        a = tri_of_entry[:-offset][same_cell]
+        b = tri_of_entry[offset:][same_cell]
+        keep = ((face_of_tri[a] != face_of_tri[b]) &
+                (lo[a] < hi[b] - UV_EPSILON).all(axis=1) &
+                (lo[b] < hi[a] - UV_EPSILON).all(axis=1))
+        pairs.append(np.minimum(a[keep], b[keep]) * tri_count + np.maximum(a[keep], b[keep]))
+        offset += 1
+
+    pairs = np.concatenate(pairs) if pairs else np.empty(0, dtype=np.int64)
+    if not len(pairs):
+        return 0
+    # Pairs sharing several cells show up more than once
+    pairs.sort()
+    pairs = pairs[np.concatenate(([True], pairs[1:] != pairs[:-1]))]
+    first = pairs // tri_count
+    second = pairs % tri_count
+
+    overlapping = np.zeros(len(first), dtype=bool)
+    for start in range(0, len(first), 1 << 18):
+        a = tri_uvs[first[start:start + (1 << 18)]]
+        b = tri_uvs[second[start:start + (1 << 18)]]
+        separated = np.zeros(len(a), dtype=bool)
+        for tris in (a, b):
+            for i in range(3):
+                edge = tris[:, (i + 1) % 3] - tris[:, i]
+                axis = np.stack([-edge[:, 1], edge[:, 0]], axis=1)
+                proj_a = np.einsum('nkj,nj->nk', a, axis)
+                proj_b = np.einsum('nkj,nj->nk', b, axis)
+                tolerance = UV_EPSILON * np.linalg.norm(axis, axis=1)
+                separated |= proj_a.max(axis=1) <= proj_b.min(axis=1) + tolerance
+                separated |= proj_b.max(axis=1) <= proj_a.min(axis=1) + tolerance
+        overlapping[start:start + len(a)] = ~separated
+
+    faces = np.concatenate([face_of_tri[first[overlapping]], face_of_tri[second[overlapping]]])
+    return len(np.unique(faces))
+
+def check_uv_buffers(buffers, texture_size):
+    uv = buffers["uv"]
+    loop_start = buffers["loop_start"]
+    loop_total = buffers["loop_total"]
+    poly_count = len(loop_start)
+
+    # Fan triangulation of every face
+    face_of_loop = np.empty(len(uv), dtype=np.int64)
+    loop_offsets = np.arange(loop_total.sum()) - np.repeat(np.cumsum(loop_total) - loop_total, loop_total)
+    face_of_loop[np.repeat(loop_start, loop_total) + loop_offsets] = np.repeat(np.arange(poly_count), loop_total)
+
+    tris_per_face = loop_total - 2
+    face_of_tri = np.repeat(np.arange(poly_count), tris_per_face)
+    tri_offsets = np.arange(len(face_of_tri)) - np.repeat(np.cumsum(tris_per_face) - tris_per_face, tris_per_face)
+    corner_a = loop_start[face_of_tri]
+    corner_b = corner_a + 1 + tri_offsets
+    tri_uvs = np.stack([uv[corner_a], uv[corner_b], uv[corner_b + 1]], axis=1)
+
+    edge_1 = tri_uvs[:, 1] - tri_uvs[:, 0]
+    edge_2 = tri_uvs[:, 2] - tri_uvs[:, 0]
+    signed_area = 0.5 * (edge_1[:, 0] * edge_2[:, 1] - edge_1[:, 1] * edge_2[:, 0])
+    face_uv_area = np.bincount(face_of_tri, signed_area, minlength=poly_count)
+
+    # Density at unit object scale, callers divide by sqrt(get_area_scale(obj))
+    area = buffers["area"]
+    uv_area = float(np.abs(face_uv_area).sum())
+    texel_density = np.sqrt(uv_area / area) * texture_size if area > 0 else 0.0
+
+    island_of_face, island_count = find_uv_islands(uv, buffers["loop_verts"], face_of_loop, poly_count)
+    outside = ((uv < -UV_EPSILON) | (uv > 1 + UV_EPSILON)).any(axis=1)
+    out_of_bounds = len(np.unique(island_of_face[face_of_loop[outside]]))
+
+    return {
+        "faces": poly_count,
+        "islands": island_count,
+        "texel_density": float(texel_density),
+        "flipped": int((face_uv_area < 0).sum()),
+        "out_of_bounds": out_of_bounds,
+        "overlaps": find_uv_overlaps(tri_uvs, face_of_tri),
+    }
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The addon package sits at the repository root, tests import the
+# modules that don't need bpy straight from it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,88 @@
+import gzip
+import struct
+
+import pytest
+
+from LP_HP_Renamer.blendfile import read_blend_id_names, read_blend_id_names_safe
+
+OBJECT_NAMES = ["Cube_low", "Cube_high", "Sphere_low"]
+COLLECTION_NAMES = ["Props"]
+
+def pack_strings(tag, strings):
+    data = tag + struct.pack('<i', len(strings)) + b''.join(s.encode() + b'\x00' for s in strings)
+    return data.ljust((len(data) + 3) & ~3, b'\x00')
+
+def make_sdna():
+    # Minimal SDNA: only the ID struct, with ID.name after five pointers
+    names = ['*next', '*prev', '*newid', '*lib', '*asset_data', 'name[66]', 'flag']
+    types = ['char', 'short', 'int', 'ID']
+    dna = b'SDNA' + pack_strings(b'NAME', names) + pack_strings(b'TYPE', types)
+    dna += (b'TLEN' + struct.pack('<4H', 1, 2, 4, 0)).ljust(12, b'\x00')
+    fields = [(3, 0), (3, 1), (3, 2), (3, 3), (3, 4), (0, 5), (2, 6)]
+    dna += b'STRC' + struct.pack('<i', 1) + struct.pack('<HH', 3, len(fields))
+    dna += b''.join(struct.pack('<HH', *field) for field in fields)
+    return dna
+
+def make_blend(new_header=False):
+    if new_header:
+        # Blender 5.0 header and 64-bit block lengths
+        header = b'BLENDER17-01v0500'
+        def block(code, body):
+            return struct.pack('<4siQqq', code, 1, 1, len(body), 1) + body
+    else:
+        header = b'BLENDER-v404'
+        def block(code, body):
+            return struct.pack('<4siQii', code, len(body), 1, 0, 1) + body
+
+    def id_block(code, name):
+        return block(code, b'\x00' * 40 + (code[:2] + name.encode()).ljust(66, b'\x00') + b'\x00' * 4)
+
+    data = header
+    data += b''.join(id_block(b'OB\x00\x00', name) for name in OBJECT_NAMES)
+    data += b''.join(id_block(b'GR\x00\x00', name) for name in COLLECTION_NAMES)
+    data += block(b'ME\x00\x00', b'\x00' * 5000)
+    data += block(b'DNA1', make_sdna())
+    data += block(b'ENDB', b'')
+    return data
+
+def check_names(path):
+    names = read_blend_id_names(str(path))
+    assert names == {"objects": OBJECT_NAMES, "collections": COLLECTION_NAMES}
+
+@pytest.mark.parametrize("new_header", [False, True])
+def test_plain(tmp_path, new_header):
+    path = tmp_path / "plain.blend"
+    path.write_bytes(make_blend(new_header))
+    check_names(path)
+
+def test_gzip(tmp_path):
+    path = tmp_path / "gzip.blend"
+    path.write_bytes(gzip.compress(make_blend()))
+    check_names(path)
+
+def test_zstd_multi_frame(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    data = make_blend()
+    compressor = zstandard.ZstdCompressor()
+    # Small odd sized frames so block headers straddle frame boundaries,
+    # followed by a skippable frame like Blender's seek table
+    frames = b''.join(compressor.compress(data[i:i + 7]) for i in range(0, len(data), 7))
+    frames += struct.pack('<II', 0x184D2A5E, 8) + b'\x00' * 8
+    path = tmp_path / "zstd.blend"
+    path.write_bytes(frames)
+    check_names(path)
+
+def test_not_a_blend(tmp_path):
+    path = tmp_path / "bad.blend"
+    path.write_bytes(b'NOTBLEND' * 4)
+    names, error = read_blend_id_names_safe(str(path))
+    assert names is None
+    assert error
+
+def test_truncated_gzip(tmp_path):
+    data = gzip.compress(make_blend())
+    path = tmp_path / "truncated.blend"
+    path.write_bytes(data[:len(data) // 2])
+    names, error = read_blend_id_names_safe(str(path))
+    assert names is None
+    assert error
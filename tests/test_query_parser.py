@@ -0,0 +1,31 @@
+import pytest
+
+from LP_HP_Renamer.query_parser import parse_query
+
+def test_hash_in_regex_is_kept():
+    terms = parse_query("name:^SM_#1 side:HP")
+    assert [term["key"] for term in terms] == ["side", "name"]
+    name = next(term for term in terms if term["key"] == "name")
+    assert name["value"].pattern == "^SM_#1"
+    assert name["value"].search("SM_#1_high")
+    assert not name["value"].search("SM_2_high")
+
+def test_backslashes_and_quotes():
+    terms = parse_query(r'name:^Rock\d collection:"My Props"')
+    values = {term["key"]: term["value"] for term in terms}
+    assert values["name"].pattern == r"^Rock\d"
+    assert values["collection"] == "My Props"
+
+def test_pair_and_negation():
+    (term,) = parse_query("!pair.!has:weighted_normal")
+    assert term == {"key": "has", "value": "WEIGHTED_NORMAL",
+                    "negate": True, "pair": True, "pair_negate": True}
+
+def test_ranges():
+    terms = parse_query("polys:10..500 tris:..20")
+    assert {term["key"]: term["value"] for term in terms} == {"polys": (10, 500), "tris": (None, 20)}
+
+@pytest.mark.parametrize("query", ["", "foo:1", "polys:a..b", "name:(", "paired:maybe"])
+def test_invalid(query):
+    with pytest.raises(ValueError):
+        parse_query(query)
@@ -0,0 +1,103 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from LP_HP_Renamer.uvcheck import check_uv_buffers, find_uv_islands
+
+# Unit quad corners, counter-clockwise
+QUAD = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+
+def make_buffers(faces, area=1.0):
+    # faces: one list of (vertex index, u, v) corners per face, the same
+    # layout read_uv_buffers copies out of a mesh
+    loops = [corner for face in faces for corner in face]
+    loop_total = np.array([len(face) for face in faces], dtype=np.int32)
+    return {
+        "uv": np.array([(u, v) for _vert, u, v in loops], dtype=np.float64).reshape(-1, 2),
+        "loop_verts": np.array([vert for vert, _u, _v in loops], dtype=np.int32),
+        "loop_start": (np.cumsum(loop_total) - loop_total).astype(np.int32),
+        "loop_total": loop_total,
+        "area": area,
+    }
+
+def make_quad(verts, offset=(0.0, 0.0), scale=(1.0, 1.0)):
+    return [(vert, offset[0] + u * scale[0], offset[1] + v * scale[1]) for vert, (u, v) in zip(verts, QUAD)]
+
+def test_unit_quad():
+    result = check_uv_buffers(make_buffers([make_quad([0, 1, 2, 3])]), 1024)
+    assert result == {
+        "faces": 1,
+        "islands": 1,
+        "texel_density": 1024.0,
+        "flipped": 0,
+        "out_of_bounds": 0,
+        "overlaps": 0,
+    }
+
+def test_shared_edge():
+    # Two halves of the 0-1 square sharing vertices 1 and 2 (and their UVs)
+    left = make_quad([0, 1, 2, 3], scale=(0.5, 1.0))
+    right = make_quad([1, 4, 5, 2], offset=(0.5, 0.0), scale=(0.5, 1.0))
+    result = check_uv_buffers(make_buffers([left, right], area=2.0), 1024)
+    assert result["islands"] == 1
+    assert result["overlaps"] == 0
+    assert result["flipped"] == 0
+    assert result["out_of_bounds"] == 0
+    assert result["texel_density"] == pytest.approx(1024.0 / np.sqrt(2.0))
+
+def test_split_seam_makes_two_islands():
+    # Same vertices on both sides of the edge but different UVs
+    left = make_quad([0, 1, 2, 3], scale=(0.5, 1.0))
+    right = make_quad([1, 4, 5, 2], offset=(0.6, 0.0), scale=(0.4, 1.0))
+    buffers = make_buffers([left, right])
+    face_of_loop = np.repeat(np.arange(2), 4)
+    island_of_face, island_count = find_uv_islands(buffers["uv"], buffers["loop_verts"], face_of_loop, 2)
+    assert island_count == 2
+    assert island_of_face[0] != island_of_face[1]
+
+def test_stacked_quads_overlap():
+    result = check_uv_buffers(make_buffers([make_quad([0, 1, 2, 3]), make_quad([4, 5, 6, 7])]), 1024)
+    assert result["islands"] == 2
+    assert result["overlaps"] == 2
+
+def test_partial_overlap():
+    result = check_uv_buffers(make_buffers([
+        make_quad([0, 1, 2, 3], scale=(0.5, 0.5)),
+        make_quad([4, 5, 6, 7], offset=(0.25, 0.25), scale=(0.5, 0.5)),
+        make_quad([8, 9, 10, 11], offset=(0.75, 0.75), scale=(0.25, 0.25)),
+    ]), 1024)
+    assert result["overlaps"] == 2
+
+def test_flipped_quad():
+    flipped = list(reversed(make_quad([4, 5, 6, 7], offset=(0.5, 0.0), scale=(0.5, 0.5))))
+    result = check_uv_buffers(make_buffers([make_quad([0, 1, 2, 3], scale=(0.5, 0.5)), flipped]), 1024)
+    assert result["flipped"] == 1
+    assert result["overlaps"] == 0
+
+def test_out_of_bounds_island():
+    inside = make_quad([0, 1, 2, 3], scale=(0.5, 0.5))
+    outside = make_quad([4, 5, 6, 7], offset=(1.5, 0.0), scale=(0.5, 0.5))
+    result = check_uv_buffers(make_buffers([inside, outside]), 1024)
+    assert result["islands"] == 2
+    assert result["out_of_bounds"] == 1
+
+def test_collapsed_face():
+    # A face with all its UVs on one point, lying inside another face
+    collapsed = [(vert, 0.5, 0.5) for vert in (4, 5, 6, 7)]
+    result = check_uv_buffers(make_buffers([make_quad([0, 1, 2, 3]), collapsed]), 1024)
+    assert result["faces"] == 2
+    assert result["overlaps"] == 0
+    assert result["flipped"] == 0
+
+def test_zero_area_mesh():
+    result = check_uv_buffers(make_buffers([make_quad([0, 1, 2, 3])], area=0.0), 1024)
+    assert result["texel_density"] == 0.0
+
+def test_triangle_and_ngon():
+    triangle = [(0, 0.0, 0.0), (1, 0.4, 0.0), (2, 0.0, 0.4)]
+    ngon = [(3, 0.6, 0.6), (4, 0.8, 0.6), (5, 0.9, 0.8), (6, 0.7, 0.9), (7, 0.6, 0.8)]
+    result = check_uv_buffers(make_buffers([triangle, ngon]), 1024)
+    assert result["faces"] == 2
+    assert result["islands"] == 2
+    assert result["overlaps"] == 0
+    assert result["flipped"] == 0
@@ -0,0 +1,95 @@
+# Measures what the addon costs Blender at startup.
+#
+#   blender -b --factory-startup --python tools/benchmark_startup.py -- --cycles 20
+#
+# Reports the package import, the first (cold) register, warm
+# register/unregister cycles, the modules pulled in by each step and the
+# import cost of the subsystems that are only loaded on first use.
+
+import argparse
+import importlib
+import json
+import os
+import statistics
+import sys
+import time
+
+import bpy
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "LP_HP_Renamer"
+LAZY_MODULES = ["exporter", "baker", "uvcheck", "blendfile", "library_audit", "query"]
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="benchmark_startup")
+    parser.add_argument("--cycles", type=int, default=10, help="Warm register/unregister cycles")
+    parser.add_argument("--json", help="Also write the results to this file")
+    return parser.parse_args(argv)
+
+def timed(func):
+    before = set(sys.modules)
+    start = time.perf_counter()
+    result = func()
+    ms = (time.perf_counter() - start) * 1000.0
+    return result, ms, sorted(set(sys.modules) - before)
+
+def summarize(samples):
+    return {
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "max_ms": round(max(samples), 3),
+    }
+
+def main():
+    args = parse_args()
+    sys.path.insert(0, REPO_ROOT)
+    results = {"blender": bpy.app.version_string, "cycles": args.cycles}
+
+    package, ms, modules = timed(lambda: importlib.import_module(PACKAGE))
+    results["import"] = {"ms": round(ms, 3), "new_modules": modules}
+
+    _result, ms, modules = timed(package.register)
+    results["register_cold"] = {"ms": round(ms, 3), "new_modules": modules}
+    _result, ms, _modules = timed(package.unregister)
+    results["unregister_cold"] = {"ms": round(ms, 3)}
+
+    register_ms = []
+    unregister_ms = []
+    for _cycle in range(args.cycles):
+        register_ms.append(timed(package.register)[1])
+        unregister_ms.append(timed(package.unregister)[1])
+    results["register_warm"] = summarize(register_ms)
+    results["unregister_warm"] = summarize(unregister_ms)
+
+    # Each lazy subsystem is timed on its own, dependencies it shares with
+    # an earlier one are already loaded and not counted again
+    lazy = {}
+    for name in LAZY_MODULES:
+        full_name = f"{PACKAGE}.{name}"
+        if full_name in sys.modules:
+            lazy[name] = {"ms": 0.0, "new_modules": [], "loaded_by_register": True}
+            continue
+        _result, ms, modules = timed(lambda: importlib.import_module(full_name))
+        lazy[name] = {"ms": round(ms, 3), "new_modules": modules, "loaded_by_register": False}
+    results["lazy_imports"] = lazy
+
+    print(f"{PACKAGE} startup benchmark (Blender {results['blender']})")
+    print(f"  import          {results['import']['ms']:9.3f} ms  {len(results['import']['new_modules'])} module(s)")
+    print(f"  register cold   {results['register_cold']['ms']:9.3f} ms  {len(results['register_cold']['new_modules'])} module(s)")
+    print(f"  unregister cold {results['unregister_cold']['ms']:9.3f} ms")
+    for key in ("register_warm", "unregister_warm"):
+        stats = results[key]
+        print(f"  {key.replace('_', ' '):15} {stats['median_ms']:9.3f} ms median "
+              f"(min {stats['min_ms']:.3f}, max {stats['max_ms']:.3f}, {args.cycles} cycles)")
+    print("  lazy subsystems:")
+    for name, stats in lazy.items():
+        note = "  LOADED BY REGISTER" if stats["loaded_by_register"] else ""
+        print(f"    {name:15} {stats['ms']:9.3f} ms  {len(stats['new_modules'])} module(s){note}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"  written to {args.json}")
+
+main()